@@ -7,6 +7,7 @@ Handles automation of AI image generation platforms
 import os
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -20,6 +21,11 @@ from webdriver_manager.core import driver
 from .prompt_manager import Prompt, GenerationResult
 from datetime import datetime
 
+# Shared pool for image decode/download/write - keeps the Selenium
+# thread free while generated images land on disk
+_POST_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                thread_name_prefix="img-post")
+
 class AIImageGenerator:
     """Base class for AI image generation automation"""
     
@@ -30,9 +36,21 @@ class AIImageGenerator:
         self.results_dir = Path("results/images")
         self.results_dir.mkdir(parents=True, exist_ok=True)
     
+    # Subclasses that must reload state between prompts set this False
+    supports_batch = True
+
     def generate_image(self, prompt: Prompt) -> GenerationResult:
         """Generate image from prompt - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement generate_image method")
+
+    def generate_images(self, prompts: List[Prompt]) -> List[GenerationResult]:
+        """Generate a batch of prompts on this generator instance.
+
+        The page/session setup from the first prompt is reused for the
+        rest of the chunk; subclasses can override for true batched
+        submission.
+        """
+        return [self.generate_image(prompt) for prompt in prompts]
     
     def download_image(self, image_url: str, filename: str) -> str:
         """Download image from URL"""
@@ -360,25 +378,26 @@ class StableDiffusionGenerator(AIImageGenerator):
         try:
             # Find generated images
             images = self.driver.find_elements(By.CSS_SELECTOR, "#txt2img_gallery img")
-            
+
+            # Collect sources on the Selenium thread, then decode/
+            # download every image in parallel on the post pool
+            stamp = time.strftime('%Y%m%d_%H%M%S')
+            futures = []
             for i, img in enumerate(images):
                 img_src = img.get_attribute('src')
-                if img_src and img_src.startswith('data:image'):
-                    # Handle base64 images
-                    filename = f"sd_{prompt_id}_{i+1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    file_path = self._save_base64_image(img_src, filename)
-                    if file_path:
-                        image_paths.append(file_path)
-                elif img_src:
-                    # Handle URL images
-                    filename = f"sd_{prompt_id}_{i+1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    downloaded_path = self.download_image(img_src, filename)
-                    if downloaded_path:
-                        image_paths.append(downloaded_path)
-                        
+                if not img_src:
+                    continue
+                filename = f"sd_{prompt_id}_{i+1}_{stamp}.png"
+                if img_src.startswith('data:image'):
+                    futures.append(_POST_POOL.submit(self._save_base64_image, img_src, filename))
+                else:
+                    futures.append(_POST_POOL.submit(self.download_image, img_src, filename))
+
+            image_paths = [path for path in (f.result() for f in futures) if path]
+
         except Exception as e:
             print(f"❌ Error downloading images: {e}")
-        
+
         return image_paths
     
     def _save_base64_image(self, base64_data: str, filename: str) -> str:
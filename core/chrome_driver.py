@@ -1,5 +1,14 @@
+import functools
+import logging
+import operator
 import os
+import platform
+import queue
 import random
+import re
+import shutil
+import subprocess
+import threading
 import time
 import json
 from pathlib import Path
@@ -14,6 +23,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
 from fake_useragent import UserAgent
 from webdriver_manager.chrome import ChromeDriverManager as WDM
+from webdriver_manager.core.driver_cache import DriverCacheManager
 from selenium.webdriver.chrome.service import Service
 from .gmail_manager import GmailManager
 from .script_manager import SeleniumScriptManager
@@ -23,6 +33,82 @@ from .thread_manager import MultiThreadGenerator, ThreadConfig
 
 from config import DEFAULT_CHROME_OPTIONS, USER_AGENTS, PROFILES_DIR
 
+logger = logging.getLogger(__name__)
+
+# Persistent chromedriver cache shared by all driver instances.
+# Keeps the downloaded binary next to the profiles so fresh runs
+# (or containers) reuse it instead of redownloading, and skips the
+# online version check while the cached driver is still fresh.
+_WDM_CACHE_DIR = str(Path(PROFILES_DIR).parent / ".wdm-cache")
+
+
+def _chromedriver_service() -> Service:
+    """Build a Service backed by the shared chromedriver cache"""
+    cache = DriverCacheManager(root_dir=_WDM_CACHE_DIR, valid_range=30)
+    return Service(WDM(cache_manager=cache).install())
+
+
+# Script fields exposed by list_available_scripts; fetched in one
+# C-level attrgetter call per script instead of per-field lookups.
+_SCRIPT_FIELDS = ("name", "display_name", "description", "file_path", "created_at")
+_script_fields = operator.attrgetter(*_SCRIPT_FIELDS)
+
+
+# Minimum free /dev/shm space before we let Chrome use shared memory
+# and a RAM-backed disk cache instead of hitting the SSD.
+_SHM_MIN_FREE_BYTES = 2 * 1024 ** 3
+
+
+def _dev_shm_has_headroom() -> bool:
+    """Check whether /dev/shm exists and has enough free space for Chrome"""
+    try:
+        return (
+            os.path.exists("/dev/shm")
+            and shutil.disk_usage("/dev/shm").free >= _SHM_MIN_FREE_BYTES
+        )
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _chrome_major() -> Optional[int]:
+    """Detect the installed Chrome major version once per process.
+
+    Passing the result as version_main= to uc.Chrome() lets
+    undetected-chromedriver skip its own version probe (subprocess +
+    HTTP request) on every driver start. Returns None if detection
+    fails so callers can fall back to auto-detection.
+    """
+    system = platform.system()
+
+    commands = []
+    if system == "Windows":
+        commands.append([
+            "reg", "query", r"HKCU\Software\Google\Chrome\BLBeacon",
+            "/v", "version"
+        ])
+    elif system == "Darwin":
+        commands.append([
+            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            "--version"
+        ])
+    else:
+        commands.append(["google-chrome", "--version"])
+        commands.append(["chromium-browser", "--version"])
+
+    for command in commands:
+        try:
+            output = subprocess.check_output(
+                command, stderr=subprocess.DEVNULL
+            ).decode(errors="ignore")
+            match = re.search(r"(\d+)\.\d+\.\d+", output)
+            if match:
+                return int(match.group(1))
+        except Exception:
+            continue
+
+    return None
+
 
 class ChromeDriverManager:
     """
@@ -34,9 +120,10 @@ class ChromeDriverManager:
         self.profile_manager = profile_manager
         self.driver: Optional[webdriver.Chrome] = None
         self.ua = UserAgent()
-        self.gmail_manager = None
-        self.script_manager = SeleniumScriptManager()
-        self.prompt_manager = PromptManager()
+        # Managers are created lazily on first use (see properties below)
+        self._gmail_manager = None
+        self._script_manager = None
+        self._prompt_manager = None
         self.thread_id = None  # For multi-threading identification
 
         # Get profile path from database or use default
@@ -48,7 +135,29 @@ class ChromeDriverManager:
 
         # Detect profile type
         self.is_imported_user_data = self._is_imported_user_data_directory()
-        
+
+    @property
+    def gmail_manager(self):
+        """Lazily create the Gmail manager once a driver is running"""
+        if self._gmail_manager is None and self.driver:
+            self._gmail_manager = GmailManager(self.driver)
+        return self._gmail_manager
+
+    @property
+    def script_manager(self):
+        """Lazily create the script manager on first use"""
+        if self._script_manager is None:
+            self._script_manager = SeleniumScriptManager()
+        return self._script_manager
+
+    @property
+    def prompt_manager(self):
+        """Lazily create the prompt manager on first use"""
+        if self._prompt_manager is None:
+            self._prompt_manager = PromptManager()
+        return self._prompt_manager
+
+
     def _get_random_user_agent(self) -> str:
         """Get a random user agent from pool or generate one"""
         try:
@@ -67,23 +176,34 @@ class ChromeDriverManager:
         """Setup Chrome options with bot bypass configurations"""
         
         options = Options()
-        
+
+        # When /dev/shm has headroom, let Chrome keep shared memory in RAM
+        # and point its disk cache at tmpfs instead of the SSD. Imported
+        # profiles keep the stock behavior so their cached state persists.
+        use_shm = _dev_shm_has_headroom() and not self.is_imported_user_data
+
         # Add default options for bot bypass
         for option in DEFAULT_CHROME_OPTIONS:
+            if use_shm and option == "--disable-dev-shm-usage":
+                continue
             options.add_argument(option)
+
+        if use_shm:
+            options.add_argument(f"--disk-cache-dir=/dev/shm/chrome-{self.profile_name}-{os.getpid()}")
+            options.add_argument("--disk-cache-size=0")
         
         # Profile settings - handle different profile types
         profile_type = self._detect_profile_type()
 
         if profile_type == "user_data_dir":
             # This is a Chrome User Data directory (contains multiple profiles)
-            print(f"📁 Using Chrome User Data directory")
+            logger.debug("📁 Using Chrome User Data directory")
             options.add_argument(f"--user-data-dir={self.profile_path}")
             options.add_argument("--profile-directory=Default")
 
         elif profile_type == "single_profile":
             # This is a single Chrome profile directory (Profile 1, Profile 2, etc.)
-            print(f"📁 Using single Chrome profile directory")
+            logger.debug("📁 Using single Chrome profile directory")
             # For single profile, use parent as user-data-dir and profile name as directory
             parent_dir = self.profile_path.parent
             profile_name = self.profile_path.name
@@ -92,7 +212,7 @@ class ChromeDriverManager:
 
         else:
             # This is a managed profile directory
-            print(f"📁 Using managed profile directory")
+            logger.debug("📁 Using managed profile directory")
             options.add_argument(f"--user-data-dir={self.profile_path}")
 
             # Create Default directory structure for new profiles
@@ -121,7 +241,8 @@ class ChromeDriverManager:
         
         # Gmail-specific stealth options
         options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--disable-dev-shm-usage')
+        if not use_shm:
+            options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--no-first-run')
         options.add_argument('--no-service-autorun')
         options.add_argument('--password-store=basic')
@@ -261,7 +382,7 @@ class ChromeDriverManager:
             """)
 
         except Exception as e:
-            print(f"Warning: Some stealth settings failed to apply: {e}")
+            logger.warning("Some stealth settings failed to apply: %s", e)
     
     def start_driver(self,
                     headless: bool = False,
@@ -282,15 +403,15 @@ class ChromeDriverManager:
                 use_undetected=use_undetected
             )
             
-            print(f"🚀 Starting Chrome driver for profile: {self.profile_name}")
-            print(f"   Use undetected: {use_undetected}")
-            print(f"   Profile path: {self.profile_path}")
-            print(f"   Headless: {headless}")
+            logger.info("🚀 Starting Chrome driver for profile: %s", self.profile_name)
+            logger.debug("   Use undetected: %s", use_undetected)
+            logger.debug("   Profile path: %s", self.profile_path)
+            logger.debug("   Headless: %s", headless)
 
             if use_undetected:
                 # Use undetected-chromedriver for better bot bypass
                 try:
-                    print(f"📦 Attempting undetected Chrome...")
+                    logger.debug("📦 Attempting undetected Chrome...")
 
                     # For imported profiles, undetected-chrome handles user-data-dir differently
                     # Remove user-data-dir from options and let undetected-chrome handle it
@@ -308,45 +429,42 @@ class ChromeDriverManager:
                         # For imported User Data directory, let undetected-chrome handle it
                         self.driver = uc.Chrome(
                             options=uc_options,
-                            version_main=None,
+                            version_main=_chrome_major(),
                             user_data_dir=str(self.profile_path)
                         )
                     else:
                         # For single profile, use regular options
                         self.driver = uc.Chrome(
                             options=options,
-                            version_main=None
+                            version_main=_chrome_major()
                         )
-                    print(f"✅ Undetected Chrome started successfully")
+                    logger.info("✅ Undetected Chrome started successfully")
 
                 except Exception as e:
-                    print(f"⚠️ Undetected Chrome failed: {e}")
-                    print(f"🔄 Falling back to regular Chrome...")
+                    logger.warning("⚠️ Undetected Chrome failed: %s", e)
+                    logger.info("🔄 Falling back to regular Chrome...")
 
                     # Fallback to regular webdriver
-                    service = Service(WDM().install())
+                    service = _chromedriver_service()
                     self.driver = webdriver.Chrome(service=service, options=options)
-                    print(f"✅ Regular Chrome started as fallback")
+                    logger.info("✅ Regular Chrome started as fallback")
             else:
                 # Use regular selenium webdriver with auto-managed ChromeDriver
-                print(f"📦 Using regular Chrome driver...")
-                service = Service(WDM().install())
+                logger.debug("📦 Using regular Chrome driver...")
+                service = _chromedriver_service()
                 self.driver = webdriver.Chrome(service=service, options=options)
-                print(f"✅ Regular Chrome started successfully")
+                logger.info("✅ Regular Chrome started successfully")
             
             # Apply additional stealth settings
             self._apply_stealth_settings()
 
-            # Initialize Gmail manager
-            self.gmail_manager = GmailManager(self.driver)
-
             # Random delay to mimic human behavior
             time.sleep(random.uniform(1, 3))
 
             return self.driver
             
         except Exception as e:
-            print(f"Error starting Chrome driver: {e}")
+            logger.error("Error starting Chrome driver: %s", e)
             raise
     
     def navigate_to(self, url: str, wait_time: int = 5):
@@ -364,7 +482,7 @@ class ChromeDriverManager:
             self._random_scroll()
             
         except Exception as e:
-            print(f"Error navigating to {url}: {e}")
+            logger.error("Error navigating to %s: %s", url, e)
             raise
     
     def _random_scroll(self):
@@ -385,7 +503,7 @@ class ChromeDriverManager:
                 time.sleep(random.uniform(0.5, 1))
                 
         except Exception as e:
-            print(f"Error during random scroll: {e}")
+            logger.debug("Error during random scroll: %s", e)
     
     def human_type(self, element, text: str, typing_speed: float = 0.1):
         """Type text with human-like speed and behavior"""
@@ -416,7 +534,7 @@ class ChromeDriverManager:
             with open(profile_data_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            print(f"Error saving profile data: {e}")
+            logger.error("Error saving profile data: %s", e)
     
     def load_profile_data(self) -> Dict[str, Any]:
         """Load profile-specific data"""
@@ -427,14 +545,14 @@ class ChromeDriverManager:
                 with open(profile_data_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except Exception as e:
-            print(f"Error loading profile data: {e}")
+            logger.error("Error loading profile data: %s", e)
         
         return {}
     
     def auto_login_gmail(self, email, password, recovery_email=None, phone=None, tfa_secret=None):
         """Auto-login to Gmail account"""
         if not self.gmail_manager:
-            print("❌ Gmail manager not initialized")
+            logger.error("❌ Gmail manager not initialized")
             return False
 
         return self.gmail_manager.auto_login(
@@ -460,52 +578,56 @@ class ChromeDriverManager:
     def test_gmail_access(self):
         """Test if Gmail is accessible and logged in"""
         try:
-            print(f"🧪 Testing Gmail access for profile: {self.profile_name}")
+            logger.info("🧪 Testing Gmail access for profile: %s", self.profile_name)
 
             # Navigate to Gmail
             self.driver.get("https://mail.google.com")
             time.sleep(5)
 
+            # Read the URL once per navigation - each current_url access
+            # is a WebDriver round trip - and lowercase it once.
             current_url = self.driver.current_url
-            print(f"📍 Current URL: {current_url}")
+            current_url_lower = current_url.lower()
+            logger.info("📍 Current URL: %s", current_url)
 
             # Check if we're logged in
-            if "mail.google.com" in current_url and "inbox" in current_url.lower():
-                print(f"✅ Gmail access successful - already logged in")
+            if "mail.google.com" in current_url and "inbox" in current_url_lower:
+                logger.info("✅ Gmail access successful - already logged in")
                 return True
             elif "accounts.google.com" in current_url:
-                print(f"⚠️ Redirected to login page - not logged in")
+                logger.info("⚠️ Redirected to login page - not logged in")
                 return False
             elif "workspace.google.com" in current_url:
-                print(f"⚠️ Redirected to Google Workspace page - trying direct Gmail access")
+                logger.info("⚠️ Redirected to Google Workspace page - trying direct Gmail access")
                 # Try direct Gmail inbox URL
                 self.driver.get("https://mail.google.com/mail/u/0/#inbox")
                 time.sleep(5)
 
                 new_url = self.driver.current_url
-                print(f"📍 After direct access: {new_url}")
+                new_url_lower = new_url.lower()
+                logger.info("📍 After direct access: %s", new_url)
 
-                if "mail.google.com" in new_url and "inbox" in new_url.lower():
-                    print(f"✅ Gmail access successful after direct navigation")
+                if "mail.google.com" in new_url and "inbox" in new_url_lower:
+                    logger.info("✅ Gmail access successful after direct navigation")
                     return True
                 elif "accounts.google.com" in new_url:
-                    print(f"⚠️ Still redirected to login - not logged in")
+                    logger.info("⚠️ Still redirected to login - not logged in")
                     return False
                 else:
-                    print(f"❓ Still unknown state after direct access: {new_url}")
+                    logger.info("❓ Still unknown state after direct access: %s", new_url)
                     return False
             else:
-                print(f"❓ Unknown state - URL: {current_url}")
+                logger.info("❓ Unknown state - URL: %s", current_url)
                 return False
 
         except Exception as e:
-            print(f"❌ Error testing Gmail access: {e}")
+            logger.error("❌ Error testing Gmail access: %s", e)
             return False
 
     def force_gmail_login_check(self):
         """Force check Gmail login status with multiple attempts"""
         try:
-            print(f"🔍 Force checking Gmail login status...")
+            logger.info("🔍 Force checking Gmail login status...")
 
             # Try multiple Gmail URLs
             gmail_urls = [
@@ -515,28 +637,28 @@ class ChromeDriverManager:
             ]
 
             for i, url in enumerate(gmail_urls):
-                print(f"🌐 Attempt {i+1}: Trying {url}")
+                logger.info("🌐 Attempt %d: Trying %s", i + 1, url)
                 self.driver.get(url)
                 time.sleep(5)
 
                 current_url = self.driver.current_url
-                print(f"📍 Result URL: {current_url}")
+                logger.info("📍 Result URL: %s", current_url)
 
                 # Check for successful Gmail access
                 if "mail.google.com" in current_url and ("inbox" in current_url or "mail" in current_url):
-                    print(f"✅ Gmail accessible via {url}")
+                    logger.info("✅ Gmail accessible via %s", url)
                     return True
 
                 # Check if we need to login
                 if "accounts.google.com" in current_url:
-                    print(f"🔐 Login required - stopped at login page")
+                    logger.info("🔐 Login required - stopped at login page")
                     return False
 
-            print(f"❌ Could not access Gmail with any URL")
+            logger.info("❌ Could not access Gmail with any URL")
             return False
 
         except Exception as e:
-            print(f"❌ Error in force Gmail check: {e}")
+            logger.error("❌ Error in force Gmail check: %s", e)
             return False
 
     def execute_script(self, script_name: str, **kwargs):
@@ -548,7 +670,7 @@ class ChromeDriverManager:
                 "error": "Driver not initialized"
             }
 
-        print(f"🚀 Executing script: {script_name} on profile: {self.profile_name}")
+        logger.info("🚀 Executing script: %s on profile: %s", script_name, self.profile_name)
 
         result = self.script_manager.execute_script(
             script_name=script_name,
@@ -557,7 +679,7 @@ class ChromeDriverManager:
             **kwargs
         )
 
-        print(f"📊 Script result: {result.message}")
+        logger.info("📊 Script result: %s", result.message)
         return {
             "success": result.success,
             "message": result.message,
@@ -569,16 +691,9 @@ class ChromeDriverManager:
 
     def list_available_scripts(self):
         """List all available scripts"""
-        scripts = self.script_manager.list_scripts()
         return [
-            {
-                "name": script.name,
-                "display_name": script.display_name,
-                "description": script.description,
-                "file_path": script.file_path,
-                "created_at": script.created_at
-            }
-            for script in scripts
+            dict(zip(_SCRIPT_FIELDS, _script_fields(script)))
+            for script in self.script_manager.list_scripts()
         ]
 
     def run_ai_generation_batch(self, prompt_file: str, platform: str, **kwargs):
@@ -591,16 +706,16 @@ class ChromeDriverManager:
             }
 
         try:
-            print(f"🚀 Starting AI image generation batch")
-            print(f"   Platform: {platform}")
-            print(f"   Prompt file: {prompt_file}")
-            print(f"   Profile: {self.profile_name}")
+            logger.info("🚀 Starting AI image generation batch")
+            logger.info("   Platform: %s", platform)
+            logger.info("   Prompt file: %s", prompt_file)
+            logger.info("   Profile: %s", self.profile_name)
 
             # Load prompts
             prompts = self.prompt_manager.load_prompts_from_file(prompt_file)
             pending_prompts = self.prompt_manager.get_pending_prompts(prompts)
 
-            print(f"📋 Loaded {len(prompts)} prompts, {len(pending_prompts)} pending")
+            logger.info("📋 Loaded %d prompts, %d pending", len(prompts), len(pending_prompts))
 
             if not pending_prompts:
                 return {
@@ -612,19 +727,47 @@ class ChromeDriverManager:
             # Create AI generator
             generator = create_generator(self.driver, platform, **kwargs)
 
-            # Process prompts
+            # Process prompts with a small producer/consumer pipeline:
+            # the producer thread drives the browser (generation + the
+            # inter-prompt delay) while the main thread does the
+            # bookkeeping (save_result, status updates, accounting), so
+            # file I/O overlaps with the next generation's wait.
+            delay = kwargs.get('delay', 5)
+            result_queue = queue.Queue(maxsize=2)
+            _DONE = object()
+
+            producer_error = []
+
+            def _produce():
+                try:
+                    for i, prompt in enumerate(pending_prompts, 1):
+                        logger.debug("🎨 Processing prompt %d/%d: %s...", i, len(pending_prompts), prompt.text[:50])
+                        self.prompt_manager.update_prompt_status(prompt, "processing")
+                        result = generator.generate_image(prompt)
+                        result_queue.put((prompt, result))
+
+                        if i < len(pending_prompts):
+                            logger.debug("⏳ Waiting %ss before next generation...", delay)
+                            time.sleep(delay)
+                except Exception as e:
+                    # Hand the error back to the main thread - swallowing it
+                    # here would report a partial batch as successful
+                    producer_error.append(e)
+                finally:
+                    result_queue.put(_DONE)
+
+            producer = threading.Thread(target=_produce, daemon=True)
+            producer.start()
+
             results = []
             successful = 0
             failed = 0
 
-            for i, prompt in enumerate(pending_prompts, 1):
-                print(f"\n🎨 Processing prompt {i}/{len(pending_prompts)}: {prompt.text[:50]}...")
-
-                # Update status
-                self.prompt_manager.update_prompt_status(prompt, "processing")
-
-                # Generate image
-                result = generator.generate_image(prompt)
+            while True:
+                item = result_queue.get()
+                if item is _DONE:
+                    break
+                prompt, result = item
 
                 # Save result
                 metadata_path = self.prompt_manager.save_result(result)
@@ -634,11 +777,11 @@ class ChromeDriverManager:
                     self.prompt_manager.update_prompt_status(prompt, "completed")
                     prompt.result_path = metadata_path
                     successful += 1
-                    print(f"✅ Success: {len(result.image_paths)} images generated")
+                    logger.debug("✅ Success: %d images generated", len(result.image_paths))
                 else:
                     self.prompt_manager.update_prompt_status(prompt, "failed", result.error)
                     failed += 1
-                    print(f"❌ Failed: {result.error}")
+                    logger.debug("❌ Failed: %s", result.error)
 
                 results.append({
                     "prompt_id": prompt.id,
@@ -649,11 +792,10 @@ class ChromeDriverManager:
                     "error": result.error
                 })
 
-                # Add delay between generations
-                if i < len(pending_prompts):
-                    delay = kwargs.get('delay', 5)
-                    print(f"⏳ Waiting {delay}s before next generation...")
-                    time.sleep(delay)
+            producer.join()
+
+            if producer_error:
+                raise producer_error[0]
 
             return {
                 "success": True,
@@ -729,15 +871,15 @@ class ChromeDriverManager:
             # If we find at least 2 indicators, it's likely a User Data directory
             is_user_data = found_indicators >= 2
 
-            print(f"🔍 Profile type detection:")
-            print(f"   Path: {self.profile_path}")
-            print(f"   Found indicators: {found_indicators}/4")
-            print(f"   Is User Data directory: {is_user_data}")
+            logger.debug("🔍 Profile type detection:")
+            logger.debug("   Path: %s", self.profile_path)
+            logger.debug("   Found indicators: %d/4", found_indicators)
+            logger.debug("   Is User Data directory: %s", is_user_data)
 
             return is_user_data
 
         except Exception as e:
-            print(f"⚠️ Error detecting profile type: {e}")
+            logger.warning("⚠️ Error detecting profile type: %s", e)
             return False
 
     def _get_profile_path(self) -> Path:
@@ -747,16 +889,16 @@ class ChromeDriverManager:
                 # Try to get profile from database
                 profile = self.profile_manager.get_profile(self.profile_name)
                 if profile and hasattr(profile, 'profile_path') and profile.profile_path:
-                    print(f"📁 Using database profile path: {profile.profile_path}")
+                    logger.debug("📁 Using database profile path: %s", profile.profile_path)
                     return Path(profile.profile_path)
 
             # Fallback to default path
             default_path = PROFILES_DIR / self.profile_name
-            print(f"📁 Using default profile path: {default_path}")
+            logger.debug("📁 Using default profile path: %s", default_path)
             return default_path
 
         except Exception as e:
-            print(f"⚠️ Error getting profile path: {e}")
+            logger.warning("⚠️ Error getting profile path: %s", e)
             # Fallback to default
             return PROFILES_DIR / self.profile_name
 
@@ -768,27 +910,27 @@ class ChromeDriverManager:
             # Check if this is a Chrome User Data directory
             # (contains Local State, Default directory, etc.)
             if (path / "Local State").exists() and (path / "Default").exists():
-                print(f"🔍 Detected: Chrome User Data directory")
+                logger.debug("🔍 Detected: Chrome User Data directory")
                 return "user_data_dir"
 
             # Check if this is a single Chrome profile directory
             # (Profile 1, Profile 2, Default, etc. - contains Preferences, Cookies, etc.)
             if (path / "Preferences").exists() or (path / "Cookies").exists():
-                print(f"🔍 Detected: Single Chrome profile directory")
+                logger.debug("🔍 Detected: Single Chrome profile directory")
                 return "single_profile"
 
             # Check if parent directory looks like Chrome User Data
             parent = path.parent
             if (parent / "Local State").exists() and path.name.startswith(("Profile", "Default")):
-                print(f"🔍 Detected: Single Chrome profile directory (by parent)")
+                logger.debug("🔍 Detected: Single Chrome profile directory (by parent)")
                 return "single_profile"
 
             # Default to managed profile
-            print(f"🔍 Detected: Managed profile directory")
+            logger.debug("🔍 Detected: Managed profile directory")
             return "managed_profile"
 
         except Exception as e:
-            print(f"⚠️ Error detecting profile type: {e}")
+            logger.warning("⚠️ Error detecting profile type: %s", e)
             return "managed_profile"
 
     def quit_driver(self):
@@ -797,10 +939,10 @@ class ChromeDriverManager:
             try:
                 self.driver.quit()
             except Exception as e:
-                print(f"Error quitting driver: {e}")
+                logger.warning("Error quitting driver: %s", e)
             finally:
                 self.driver = None
-                self.gmail_manager = None
+                self._gmail_manager = None
     
     def __enter__(self):
         return self
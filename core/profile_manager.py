@@ -1,17 +1,99 @@
+import atexit
+import hashlib
+import logging
 import os
-import json
+import orjson
 import shutil
 import sqlite3
-import glob
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 from config import PROFILES_DIR, DATABASE_URL
 
+# Optional: stream-parses Chrome's multi-MB Preferences files without
+# materializing them (install manually if needed)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to pretty JSON bytes (orjson: ~5x faster than stdlib)"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+_loads = orjson.loads
+
+# Per-session bookkeeping fields that don't need to be mirrored into
+# the profile's metadata.json on every change
+_TRIVIAL_UPDATE_FIELDS = {'status', 'last_used'}
+
+# Chrome regenerates these on next launch; they hold the bulk of a
+# profile's bytes and are pointless to duplicate on import
+_IMPORT_IGNORE = shutil.ignore_patterns(
+    'Cache', 'Code Cache', 'GPUCache', 'Service Worker', '*.tmp', '*.old'
+)
+
+
+def _linkcopy(src, dst, *, follow_symlinks=True):
+    """Hardlink instead of copying when both sides share a filesystem"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+# Explicit column list for profile SELECTs - keeps row hydration
+# independent of physical column order after migrations
+PROFILE_COLS = (
+    "name, display_name, user_agent, proxy, window_width, window_height, "
+    "headless, created_at, last_used, "
+    'status AS "status [STATUS]", '
+    'custom_options AS "custom_options [OPTIONS]", notes, '
+    "gmail_email, gmail_password, gmail_recovery_email, gmail_phone, "
+    "gmail_2fa_secret, gmail_auto_login, profile_path"
+)
+
+
+# Fallback UA stamped on imported profiles (their real UA comes from Chrome)
+_DEFAULT_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def _now_iso(_now=datetime.now, _iso=datetime.isoformat) -> str:
+    """Current time as an ISO string (bound methods skip two lookups)"""
+    return _iso(_now())
+
+
+# Single prepared-once INSERT shared by create_profile,
+# import_chrome_profile and the bulk create path
+# Fixed SQL for the per-session single-field updates, so the statement
+# cache always hits instead of re-parsing a freshly joined UPDATE string
+_UPDATE_STATUS_SQL = "UPDATE profiles SET status = ? WHERE name = ?"
+_UPDATE_LAST_USED_SQL = "UPDATE profiles SET last_used = ? WHERE name = ?"
+
+_INSERT_SQL = '''
+    INSERT INTO profiles (
+        name, display_name, user_agent, proxy,
+        window_width, window_height, headless,
+        created_at, last_used, status, custom_options, notes,
+        gmail_email, gmail_password, gmail_recovery_email,
+        gmail_phone, gmail_2fa_secret, gmail_auto_login,
+        profile_path
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 
 class ProfileStatus(Enum):
     INACTIVE = "inactive"
@@ -20,7 +102,16 @@ class ProfileStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Converters run inside sqlite3's C fetch loop (PARSE_COLNAMES picks
+# them up from the [STATUS]/[OPTIONS] aliases in PROFILE_COLS), so row
+# hydration gets typed values without per-row Python conversion. The
+# value->member dict skips Enum.__call__ on every row.
+_STATUS_BY_VALUE = {status.value: status for status in ProfileStatus}
+sqlite3.register_converter('STATUS', lambda value: _STATUS_BY_VALUE[value.decode()])
+sqlite3.register_converter('OPTIONS', _loads)
+
+
+@dataclass(slots=True)
 class ChromeProfile:
     """Chrome profile data structure"""
     name: str
@@ -45,10 +136,85 @@ class ChromeProfile:
     
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.now().isoformat()
+            self.created_at = _now_iso()
         if self.custom_options is None:
             self.custom_options = []
 
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'ChromeProfile':
+        """Build a profile from a PROFILE_COLS database row"""
+        return cls(
+            name=row['name'],
+            display_name=row['display_name'],
+            user_agent=row['user_agent'],
+            proxy=row['proxy'],
+            window_size=(row['window_width'], row['window_height']),
+            headless=bool(row['headless']),
+            created_at=row['created_at'],
+            last_used=row['last_used'],
+            status=row['status'],
+            custom_options=row['custom_options'] if row['custom_options'] is not None else [],
+            notes=row['notes'] or "",
+            gmail_email=row['gmail_email'],
+            gmail_password=row['gmail_password'],
+            gmail_recovery_email=row['gmail_recovery_email'],
+            gmail_phone=row['gmail_phone'],
+            gmail_2fa_secret=row['gmail_2fa_secret'],
+            gmail_auto_login=bool(row['gmail_auto_login']) if row['gmail_auto_login'] is not None else False,
+            profile_path=row['profile_path']
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for metadata serialization
+
+        Spelled out field by field - dataclasses.asdict walks the
+        fields by reflection and deep-copies on every call
+        """
+        return {
+            'name': self.name,
+            'display_name': self.display_name,
+            'user_agent': self.user_agent,
+            'proxy': self.proxy,
+            'window_size': self.window_size,
+            'headless': self.headless,
+            'created_at': self.created_at,
+            'last_used': self.last_used,
+            'status': self.status.value,
+            'custom_options': self.custom_options,
+            'notes': self.notes,
+            'profile_path': self.profile_path,
+            'gmail_email': self.gmail_email,
+            'gmail_password': self.gmail_password,
+            'gmail_recovery_email': self.gmail_recovery_email,
+            'gmail_phone': self.gmail_phone,
+            'gmail_2fa_secret': self.gmail_2fa_secret,
+            'gmail_auto_login': self.gmail_auto_login,
+        }
+
+    def to_row(self) -> tuple:
+        """Bind values for _INSERT_SQL in declared column order"""
+        return (
+            self.name,
+            self.display_name,
+            self.user_agent,
+            self.proxy,
+            self.window_size[0],
+            self.window_size[1],
+            self.headless,
+            self.created_at,
+            self.last_used,
+            self.status.value,
+            orjson.dumps(self.custom_options or []).decode(),
+            self.notes,
+            self.gmail_email,
+            self.gmail_password,
+            self.gmail_recovery_email,
+            self.gmail_phone,
+            self.gmail_2fa_secret,
+            self.gmail_auto_login,
+            self.profile_path,
+        )
+
 
 class ProfileManager:
     """
@@ -57,14 +223,93 @@ class ProfileManager:
     
     def __init__(self):
         self.db_path = DATABASE_URL.replace("sqlite:///", "")
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = []
+        # mtime-keyed caches for the system profile scan: the UI polls
+        # these lists far more often than Chrome touches the directories
+        self._system_scan_cache: Dict[str, tuple] = {}
+        self._profile_info_cache: Dict[str, tuple] = {}
+        # Content hash of each profile's last written metadata.json,
+        # used to skip byte-identical rewrites
+        self._meta_hash: Dict[str, bytes] = {}
+        # Slow filesystem work (profile tree removal, metadata writes)
+        # runs here so callers aren't blocked on disk I/O
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pm-io')
+        self._meta_lock = threading.Lock()
+        self._pending_meta: Dict[str, ChromeProfile] = {}
+        atexit.register(self._io_pool.shutdown, wait=False)
+        atexit.register(self.close)
         self._init_database()
-    
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the long-lived connection for the calling thread
+
+        Opening a fresh connection per call pays file open, lock setup
+        and a cold page cache every time; one connection per thread
+        keeps SQLite's cache hot across CRUD calls.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   detect_types=sqlite3.PARSE_COLNAMES)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA temp_store=memory")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _cursor(self, commit: bool = False):
+        """Yield a cursor on the thread's persistent connection"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            if commit:
+                conn.commit()
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def _tx(self):
+        """Run several statements as one transaction (single WAL commit)
+
+        BEGIN IMMEDIATE takes the write lock up front, so the commit
+        can't fail with SQLITE_BUSY halfway through a read-to-write
+        lock upgrade.
+        """
+        conn = self._get_connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def close(self):
+        """Close all pooled connections (registered with atexit)"""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
     def _init_database(self):
         """Initialize SQLite database for profile management"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_connection()
             cursor = conn.cursor()
-            
+
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS profiles (
                     name TEXT PRIMARY KEY,
@@ -90,13 +335,12 @@ class ProfileManager:
             ''')
 
             # Add profile_path column if it doesn't exist (migration)
-            try:
+            existing = {row[1] for row in cursor.execute('PRAGMA table_info(profiles)')}
+            if 'profile_path' not in existing:
                 cursor.execute('ALTER TABLE profiles ADD COLUMN profile_path TEXT')
-                print("✅ Added profile_path column to database")
-            except sqlite3.OperationalError:
-                # Column already exists
-                pass
-            
+                logger.info("✅ Added profile_path column to database")
+
+
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS profile_sessions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -113,11 +357,44 @@ class ProfileManager:
             # Add Gmail columns if they don't exist (migration)
             self._migrate_gmail_columns(cursor)
 
+            # Profiles joined with their session stats in one query -
+            # the UI reads this instead of going back per profile
+            cursor.execute('''
+                CREATE VIEW IF NOT EXISTS v_profiles AS
+                SELECT p.*,
+                       (SELECT COUNT(*) FROM profile_sessions s
+                        WHERE s.profile_name = p.name AND s.status = 'active') AS active_sessions,
+                       (SELECT MAX(start_time) FROM profile_sessions s
+                        WHERE s.profile_name = p.name) AS last_session_start
+                FROM profiles p
+            ''')
+
+            # Partial indexes keep the hot queries (active profiles,
+            # open sessions) off full table scans
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_profiles_status
+                ON profiles(status) WHERE status IN ('active', 'running')
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_profile
+                ON profile_sessions(profile_name)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_active
+                ON profile_sessions(status) WHERE status = 'active'
+            ''')
+
             conn.commit()
-            conn.close()
+
+            # Keep the set of known names in memory so existence checks
+            # don't round-trip through SQLite at all
+            cursor.execute('SELECT name FROM profiles')
+            self._name_set = {row[0] for row in cursor.fetchall()}
+
+            cursor.close()
 
         except Exception as e:
-            print(f"Error initializing database: {e}")
+            logger.error("Error initializing database: %s", e)
             raise
 
     def _migrate_gmail_columns(self, cursor):
@@ -131,12 +408,12 @@ class ProfileManager:
             ('gmail_auto_login', 'BOOLEAN DEFAULT FALSE')
         ]
 
+        # Probe the schema once instead of firing six ALTERs that fail
+        # (and invalidate SQLite's schema cache) on every startup
+        existing = {row[1] for row in cursor.execute('PRAGMA table_info(profiles)')}
         for column_name, column_type in gmail_columns:
-            try:
+            if column_name not in existing:
                 cursor.execute(f'ALTER TABLE profiles ADD COLUMN {column_name} {column_type}')
-            except sqlite3.OperationalError:
-                # Column already exists
-                pass
     
     def create_profile(self, profile: ChromeProfile) -> bool:
         """Create a new Chrome profile"""
@@ -150,50 +427,70 @@ class ProfileManager:
             profile_path.mkdir(exist_ok=True)
             
             # Save to database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO profiles (
-                    name, display_name, user_agent, proxy,
-                    window_width, window_height, headless,
-                    created_at, status, custom_options, notes,
-                    gmail_email, gmail_password, gmail_recovery_email,
-                    gmail_phone, gmail_2fa_secret, gmail_auto_login
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                profile.name,
-                profile.display_name,
-                profile.user_agent,
-                profile.proxy,
-                profile.window_size[0],
-                profile.window_size[1],
-                profile.headless,
-                profile.created_at,
-                profile.status.value,
-                json.dumps(profile.custom_options),
-                profile.notes,
-                profile.gmail_email,
-                profile.gmail_password,
-                profile.gmail_recovery_email,
-                profile.gmail_phone,
-                profile.gmail_2fa_secret,
-                profile.gmail_auto_login
-            ))
-            
-            conn.commit()
-            conn.close()
-            
+            with self._cursor(commit=True) as cursor:
+                cursor.execute(_INSERT_SQL, profile.to_row())
+
             # Save profile metadata
             self._save_profile_metadata(profile)
-            
+
+            with self._lock:
+                self._name_set.add(profile.name)
+
             return True
-            
+
         except Exception as e:
-            print(f"Error creating profile: {e}")
+            logger.error("Error creating profile: %s", e)
             return False
+
+    def create_profiles(self, profiles: List[ChromeProfile]) -> int:
+        """Create multiple profiles in one transaction
+
+        executemany reuses the prepared INSERT and the batch lands as a
+        single commit - one fsync for the lot instead of one per profile.
+        Returns the number of profiles created.
+        """
+        try:
+            new_profiles = [p for p in profiles if not self.profile_exists(p.name)]
+            if not new_profiles:
+                return 0
+
+            with self._tx() as conn:
+                conn.executemany(_INSERT_SQL, (p.to_row() for p in new_profiles))
+
+            for profile in new_profiles:
+                (PROFILES_DIR / profile.name).mkdir(exist_ok=True)
+                self._save_profile_metadata(profile)
+
+            with self._lock:
+                self._name_set.update(p.name for p in new_profiles)
+
+            return len(new_profiles)
+
+        except Exception as e:
+            logger.error("Error creating profiles in bulk: %s", e)
+            return 0
     
     def _save_profile_metadata(self, profile: ChromeProfile):
+        """Queue a metadata save on the I/O pool (last write wins)
+
+        metadata.json is a mirror of the database, so callers don't need
+        to block on the file write; several queued saves for the same
+        profile collapse into the newest one.
+        """
+        with self._meta_lock:
+            self._pending_meta[profile.name] = profile
+        self._io_pool.submit(self._flush_profile_metadata, profile.name)
+
+    def _flush_profile_metadata(self, name: str):
+        """Write the newest pending metadata for a profile, if any"""
+        with self._meta_lock:
+            profile = self._pending_meta.pop(name, None)
+        if profile is None:
+            # An earlier queued task already wrote a newer snapshot
+            return
+        self._write_profile_metadata(profile)
+
+    def _write_profile_metadata(self, profile: ChromeProfile):
         """Save profile metadata to JSON file"""
         try:
             # Determine where to save metadata
@@ -202,112 +499,128 @@ class ProfileManager:
                 metadata_dir = Path("metadata")
                 metadata_dir.mkdir(exist_ok=True)
                 metadata_file = metadata_dir / f"{profile.name}.json"
-                print(f"💾 Saving metadata for direct path profile: {metadata_file}")
+                logger.debug("💾 Saving metadata for direct path profile: %s", metadata_file)
             else:
                 # For managed profiles, save in profile directory
                 profile_path = PROFILES_DIR / profile.name
                 profile_path.mkdir(exist_ok=True)  # Ensure directory exists
                 metadata_file = profile_path / "metadata.json"
-                print(f"💾 Saving metadata for managed profile: {metadata_file}")
+                logger.debug("💾 Saving metadata for managed profile: %s", metadata_file)
 
-            metadata = asdict(profile)
-            metadata['status'] = profile.status.value
+            data = _dumps(profile.to_dict())
 
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # No-op if the content didn't change (update_last_used spam)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._meta_hash.get(profile.name) == digest:
+                logger.debug("Metadata for %s unchanged, skipping write", profile.name)
+                return
 
-            print(f"✅ Profile metadata saved successfully")
+            # Write to a temp file and rename so a crash mid-write can't
+            # leave a truncated metadata.json behind
+            tmp_file = metadata_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, metadata_file)
+            self._meta_hash[profile.name] = digest
+
+            logger.info("✅ Profile metadata saved successfully")
 
         except Exception as e:
-            print(f"❌ Error saving profile metadata: {e}")
+            logger.error("❌ Error saving profile metadata: %s", e)
     
     def get_profile(self, name: str) -> Optional[ChromeProfile]:
         """Get profile by name"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM profiles WHERE name = ?', (name,))
-            row = cursor.fetchone()
-            conn.close()
-            
+            with self._cursor() as cursor:
+                cursor.execute(f'SELECT {PROFILE_COLS} FROM profiles WHERE name = ?', (name,))
+                row = cursor.fetchone()
+
             if row:
-                return ChromeProfile(
-                    name=row[0],
-                    display_name=row[1],
-                    user_agent=row[2],
-                    proxy=row[3],
-                    window_size=(row[4], row[5]),
-                    headless=bool(row[6]),
-                    created_at=row[7],
-                    last_used=row[8],
-                    status=ProfileStatus(row[9]),
-                    custom_options=json.loads(row[10]) if row[10] else [],
-                    notes=row[11] or "",
-                    gmail_email=row[12],
-                    gmail_password=row[13],
-                    gmail_recovery_email=row[14],
-                    gmail_phone=row[15],
-                    gmail_2fa_secret=row[16],
-                    gmail_auto_login=bool(row[17]) if row[17] is not None else False,
-                    profile_path=row[18] if len(row) > 18 else None
-                )
-            
+                return ChromeProfile.from_row(row)
+
             return None
             
         except Exception as e:
-            print(f"Error getting profile: {e}")
+            logger.error("Error getting profile: %s", e)
             return None
     
     def list_profiles(self) -> List[ChromeProfile]:
         """List all profiles"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM profiles ORDER BY created_at DESC')
-            rows = cursor.fetchall()
-            conn.close()
-            
-            profiles = []
-            for row in rows:
-                profile = ChromeProfile(
-                    name=row[0],
-                    display_name=row[1],
-                    user_agent=row[2],
-                    proxy=row[3],
-                    window_size=(row[4], row[5]),
-                    headless=bool(row[6]),
-                    created_at=row[7],
-                    last_used=row[8],
-                    status=ProfileStatus(row[9]),
-                    custom_options=json.loads(row[10]) if row[10] else [],
-                    notes=row[11] or "",
-                    gmail_email=row[12],
-                    gmail_password=row[13],
-                    gmail_recovery_email=row[14],
-                    gmail_phone=row[15],
-                    gmail_2fa_secret=row[16],
-                    gmail_auto_login=bool(row[17]) if row[17] is not None else False,
-                    profile_path=row[18] if len(row) > 18 else None
-                )
-                profiles.append(profile)
-            
-            return profiles
+            # Iterate the cursor directly - no intermediate fetchall
+            # buffer of raw rows next to the profile list
+            with self._cursor() as cursor:
+                cursor.execute(f'SELECT {PROFILE_COLS} FROM profiles ORDER BY created_at DESC')
+                return [ChromeProfile.from_row(row) for row in cursor]
             
         except Exception as e:
-            print(f"Error listing profiles: {e}")
+            logger.error("Error listing profiles: %s", e)
             return []
     
+    def list_profiles_summary(self) -> List[Dict[str, Any]]:
+        """Lightweight profile list for display
+
+        Selects only the four fields the list view shows - no
+        custom_options parsing and no full ChromeProfile construction
+        per row.
+        """
+        try:
+            with self._cursor() as cursor:
+                cursor.execute('''
+                    SELECT name, display_name, status AS "status [STATUS]", last_used
+                    FROM profiles ORDER BY created_at DESC
+                ''')
+                return [
+                    {
+                        'name': row['name'],
+                        'display_name': row['display_name'],
+                        'status': row['status'],
+                        'last_used': row['last_used'],
+                    }
+                    for row in cursor
+                ]
+
+        except Exception as e:
+            logger.error("Error listing profile summaries: %s", e)
+            return []
+
+    def list_profiles_with_session_info(self) -> List[Dict[str, Any]]:
+        """List all profiles with their session stats in one round trip
+
+        Reads the v_profiles view, so the active-session count and last
+        session start come back with each row instead of the UI issuing
+        a follow-up query per profile.
+        """
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(f'''
+                    SELECT {PROFILE_COLS}, active_sessions, last_session_start
+                    FROM v_profiles ORDER BY created_at DESC
+                ''')
+                rows = cursor.fetchall()
+
+            results = []
+            for row in rows:
+                entry = ChromeProfile.from_row(row).to_dict()
+                entry['active_sessions'] = row['active_sessions']
+                entry['last_session_start'] = row['last_session_start']
+                results.append(entry)
+
+            return results
+
+        except Exception as e:
+            logger.error("Error listing profiles with session info: %s", e)
+            return []
+
     def update_profile(self, name: str, updates: Dict[str, Any]) -> bool:
         """Update profile with new data"""
         try:
-            if not self.profile_exists(name):
+            # Load once; the updated profile is rebuilt in memory below
+            # instead of re-querying after the UPDATE
+            profile = self.get_profile(name)
+            if not profile:
                 return False
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
+
             # Build update query dynamically
             set_clauses = []
             values = []
@@ -318,7 +631,7 @@ class ProfileManager:
                     values.extend([value[0], value[1]])
                 elif key == 'custom_options':
                     set_clauses.append('custom_options = ?')
-                    values.append(json.dumps(value))
+                    values.append(orjson.dumps(value).decode())
                 elif key == 'status':
                     set_clauses.append('status = ?')
                     values.append(value.value if isinstance(value, ProfileStatus) else value)
@@ -329,20 +642,25 @@ class ProfileManager:
             if set_clauses:
                 query = f"UPDATE profiles SET {', '.join(set_clauses)} WHERE name = ?"
                 values.append(name)
-                cursor.execute(query, values)
-                conn.commit()
-            
-            conn.close()
-            
-            # Update metadata file
-            profile = self.get_profile(name)
-            if profile:
+                with self._cursor(commit=True) as cursor:
+                    cursor.execute(query, values)
+
+            # Mirror to the metadata file by applying the updates onto
+            # the already-loaded profile - no second SELECT. Pure
+            # bookkeeping changes (status/last_used) skip the rewrite,
+            # which keeps update_last_used off the disk entirely.
+            if not set(updates) <= _TRIVIAL_UPDATE_FIELDS:
+                for key, value in updates.items():
+                    if key == 'status' and not isinstance(value, ProfileStatus):
+                        value = ProfileStatus(value)
+                    if hasattr(profile, key):
+                        setattr(profile, key, value)
                 self._save_profile_metadata(profile)
-            
+
             return True
             
         except Exception as e:
-            print(f"Error updating profile: {e}")
+            logger.error("Error updating profile: %s", e)
             return False
     
     def delete_profile(self, name: str, delete_files: bool = True) -> bool:
@@ -351,26 +669,32 @@ class ProfileManager:
             if not self.profile_exists(name):
                 return False
             
-            # Delete from database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('DELETE FROM profile_sessions WHERE profile_name = ?', (name,))
-            cursor.execute('DELETE FROM profiles WHERE name = ?', (name,))
-            
-            conn.commit()
-            conn.close()
-            
-            # Delete profile directory if requested
+            # Delete from database - both DELETEs in one transaction
+            with self._tx() as conn:
+                conn.execute('DELETE FROM profile_sessions WHERE profile_name = ?', (name,))
+                conn.execute('DELETE FROM profiles WHERE name = ?', (name,))
+
+            with self._lock:
+                self._name_set.discard(name)
+            self._meta_hash.pop(name, None)
+
+            # Delete profile directory if requested - removal runs in
+            # the background so the DB delete returns immediately, and
+            # ignore_errors rides out transient locks while Chrome exits
             if delete_files:
                 profile_path = PROFILES_DIR / name
                 if profile_path.exists():
-                    shutil.rmtree(profile_path)
-            
+                    target = str(profile_path)
+                    if os.name == 'nt':
+                        # Extended-length prefix: Chrome's Service Worker
+                        # dirs routinely exceed the 260-char MAX_PATH
+                        target = '\\\\?\\' + os.path.abspath(target)
+                    self._io_pool.submit(shutil.rmtree, target, ignore_errors=True)
+
             return True
             
         except Exception as e:
-            print(f"Error deleting profile: {e}")
+            logger.error("Error deleting profile: %s", e)
             return False
 
     def get_system_chrome_profiles(self) -> List[Dict[str, Any]]:
@@ -386,11 +710,24 @@ class ProfileManager:
         ]
 
         for chrome_path in chrome_paths:
-            if os.path.exists(chrome_path):
-                try:
-                    profiles.extend(self._scan_chrome_directory(chrome_path))
-                except Exception as e:
-                    print(f"Error scanning {chrome_path}: {e}")
+            try:
+                mtime = os.stat(chrome_path).st_mtime_ns
+            except OSError:
+                continue
+
+            # Serve unchanged directories from cache - rescanning reparses
+            # every multi-MB Preferences file and stats the whole tree
+            cached = self._system_scan_cache.get(chrome_path)
+            if cached and cached[0] == mtime:
+                profiles.extend(cached[1])
+                continue
+
+            try:
+                scanned = self._scan_chrome_directory(chrome_path)
+                self._system_scan_cache[chrome_path] = (mtime, scanned)
+                profiles.extend(scanned)
+            except Exception as e:
+                logger.error("Error scanning %s: %s", chrome_path, e)
 
         return profiles
 
@@ -398,25 +735,41 @@ class ProfileManager:
         """Scan Chrome directory for profiles"""
         profiles = []
 
-        # Look for profile directories
-        profile_patterns = [
-            "Default",
-            "Profile *",
-            "Person *"
-        ]
-
-        for pattern in profile_patterns:
-            profile_dirs = glob.glob(os.path.join(chrome_path, pattern))
-
-            for profile_dir in profile_dirs:
-                if os.path.isdir(profile_dir):
-                    profile_info = self._get_profile_info(profile_dir)
-                    if profile_info:
-                        profiles.append(profile_info)
+        # One scandir pass instead of separate globs per pattern -
+        # the entries already carry type and stat info, so no extra
+        # isdir/getmtime syscalls per candidate directory
+        candidates = []
+        with os.scandir(chrome_path) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                name = entry.name
+                if name == "Default" or name.startswith("Profile ") or name.startswith("Person "):
+                    candidates.append((entry.path, entry.stat()))
+
+        to_scan = []
+        for path, stat in candidates:
+            cached = self._profile_info_cache.get(path)
+            if cached and cached[0] == stat.st_mtime_ns:
+                if cached[1]:
+                    profiles.append(cached[1])
+            else:
+                to_scan.append((path, stat))
+
+        if to_scan:
+            # Uncached profiles each cost several stats plus a
+            # Preferences parse; they're independent and I/O bound, so
+            # fan them out instead of paying the latencies in sequence
+            with ThreadPoolExecutor(max_workers=min(8, len(to_scan))) as executor:
+                infos = executor.map(lambda args: self._get_profile_info(*args), to_scan)
+                for (path, stat), info in zip(to_scan, infos):
+                    self._profile_info_cache[path] = (stat.st_mtime_ns, info)
+                    if info:
+                        profiles.append(info)
 
         return profiles
 
-    def _get_profile_info(self, profile_dir: str) -> Optional[Dict[str, Any]]:
+    def _get_profile_info(self, profile_dir: str, dir_stat: os.stat_result = None) -> Optional[Dict[str, Any]]:
         """Get information about a Chrome profile"""
         try:
             profile_name = os.path.basename(profile_dir)
@@ -429,25 +782,21 @@ class ProfileManager:
             # Read preferences to get profile info
             display_name = profile_name
             try:
-                with open(preferences_file, 'r', encoding='utf-8') as f:
-                    prefs = json.load(f)
-
-                    # Get profile display name
-                    if 'profile' in prefs and 'name' in prefs['profile']:
-                        display_name = prefs['profile']['name']
-
-                    # Get account info if available
-                    account_info = self._extract_account_info(prefs)
+                name, account_info = self._read_preferences(preferences_file)
+                if name:
+                    display_name = name
 
             except Exception as e:
-                print(f"Warning: Could not read preferences for {profile_name}: {e}")
+                logger.warning("Warning: Could not read preferences for %s: %s", profile_name, e)
                 account_info = {}
 
             # Get profile size
             profile_size = self._get_directory_size(profile_dir)
 
-            # Check last modified time
-            last_modified = datetime.fromtimestamp(os.path.getmtime(profile_dir)).isoformat()
+            # Check last modified time (reuse the scandir stat when available)
+            if dir_stat is None:
+                dir_stat = os.stat(profile_dir)
+            last_modified = datetime.fromtimestamp(dir_stat.st_mtime).isoformat()
 
             return {
                 'name': profile_name,
@@ -462,9 +811,42 @@ class ProfileManager:
             }
 
         except Exception as e:
-            print(f"Error getting profile info for {profile_dir}: {e}")
+            logger.error("Error getting profile info for %s: %s", profile_dir, e)
             return None
 
+    def _read_preferences(self, preferences_file: str) -> tuple:
+        """Pull display name and account info out of a Preferences file
+
+        Preferences can run to several MB; with ijson available only the
+        three wanted keys are pulled off the stream and parsing stops as
+        soon as both are seen, instead of building the whole document.
+        """
+        if ijson is not None:
+            display_name = None
+            account_info = {}
+            with open(preferences_file, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if event != 'string':
+                        continue
+                    if prefix == 'profile.name':
+                        display_name = value
+                    elif prefix in ('account_info.item.email', 'signin.allowed_username'):
+                        account_info.setdefault('email', value)
+                    if display_name and account_info:
+                        break
+            return display_name, account_info
+
+        # Fallback: read bytes and let orjson parse them directly,
+        # skipping the UTF-8 decode round-trip stdlib json would force
+        with open(preferences_file, 'rb') as f:
+            prefs = _loads(f.read())
+
+        display_name = None
+        if 'profile' in prefs and 'name' in prefs['profile']:
+            display_name = prefs['profile']['name']
+
+        return display_name, self._extract_account_info(prefs)
+
     def _extract_account_info(self, prefs: dict) -> Dict[str, Any]:
         """Extract account information from Chrome preferences"""
         account_info = {}
@@ -482,33 +864,40 @@ class ProfileManager:
                 account_info['email'] = prefs['signin']['allowed_username']
 
         except Exception as e:
-            print(f"Warning: Could not extract account info: {e}")
+            logger.warning("Warning: Could not extract account info: %s", e)
 
         return account_info
 
     def _get_directory_size(self, directory: str) -> int:
         """Get total size of directory in bytes"""
+        # os.walk plus getsize stats every file twice; walking scandir
+        # iterators directly reuses the stat each entry already carries
         total_size = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except (OSError, FileNotFoundError):
-                        pass
-        except Exception:
-            pass
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                            elif entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
         return total_size
 
     def import_chrome_profile(self, source_path: str, profile_name: str, display_name: str = None, use_direct_path: bool = True) -> bool:
         """Import existing Chrome profile - either copy or use direct path"""
         try:
-            print(f"🔍 Starting import process...")
-            print(f"   Source: {source_path}")
-            print(f"   Profile name: {profile_name}")
-            print(f"   Display name: {display_name}")
-            print(f"   Use direct path: {use_direct_path}")
+            logger.info("🔍 Starting import process...")
+            logger.debug("   Source: %s", source_path)
+            logger.debug("   Profile name: %s", profile_name)
+            logger.debug("   Display name: %s", display_name)
+            logger.debug("   Use direct path: %s", use_direct_path)
 
             # Validate inputs
             if not source_path or not profile_name:
@@ -533,20 +922,20 @@ class ProfileManager:
 
             if use_direct_path:
                 # Use direct path - no copying needed
-                print(f"📁 Using direct path to Chrome profile: {source_path}")
+                logger.info("📁 Using direct path to Chrome profile: %s", source_path)
                 profile_path = source_path
                 notes = f"Direct link to system Chrome profile: {source_path}"
             else:
                 # Copy profile to managed directory
                 dest_path = PROFILES_DIR / profile_name
-                print(f"📥 Copying Chrome profile from {source_path} to {dest_path}")
+                logger.info("📥 Copying Chrome profile from %s to %s", source_path, dest_path)
 
                 # Ensure PROFILES_DIR exists
                 PROFILES_DIR.mkdir(exist_ok=True)
 
                 # Remove destination if exists
                 if dest_path.exists():
-                    print(f"🗑️ Removing existing destination: {dest_path}")
+                    logger.debug("🗑️ Removing existing destination: %s", dest_path)
                     try:
                         self._remove_directory_with_retry(dest_path)
                     except Exception as remove_error:
@@ -555,13 +944,16 @@ class ProfileManager:
                         timestamp = int(time.time())
                         profile_name = f"{profile_name}_{timestamp}"
                         dest_path = PROFILES_DIR / profile_name
-                        print(f"📝 New profile name: {profile_name}")
+                        logger.info("📝 New profile name: %s", profile_name)
 
-                # Copy profile directory
-                print(f"📂 Copying profile directory...")
+                # Copy profile directory - hardlink where possible and
+                # leave Chrome's cache directories behind
+                logger.debug("📂 Copying profile directory...")
                 try:
-                    shutil.copytree(source_path, dest_path)
-                    print(f"✅ Profile directory copied successfully")
+                    shutil.copytree(source_path, dest_path,
+                                    copy_function=_linkcopy,
+                                    ignore=_IMPORT_IGNORE)
+                    logger.info("✅ Profile directory copied successfully")
                 except Exception as copy_error:
                     raise ValueError(f"Failed to copy profile directory: {str(copy_error)}")
 
@@ -569,15 +961,15 @@ class ProfileManager:
                 notes = f"Copied from system Chrome profile: {source_path}"
 
             # Create profile entry in database
-            print(f"💾 Creating database entry...")
+            logger.debug("💾 Creating database entry...")
 
             # Set created_at timestamp
-            created_at = datetime.now().isoformat()
+            created_at = _now_iso()
 
             profile = ChromeProfile(
                 name=profile_name,
                 display_name=display_name or profile_name,
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                user_agent=_DEFAULT_UA,
                 notes=notes,
                 created_at=created_at,
                 custom_options=[],
@@ -586,56 +978,24 @@ class ProfileManager:
 
             # Save to database with profile path
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
+                logger.debug("📝 Inserting profile into database...")
 
-                print(f"📝 Inserting profile into database...")
+                with self._cursor(commit=True) as cursor:
+                    cursor.execute(_INSERT_SQL, profile.to_row())
 
-                cursor.execute('''
-                    INSERT INTO profiles (
-                        name, display_name, user_agent, proxy,
-                        window_width, window_height, headless,
-                        created_at, last_used, status, custom_options, notes,
-                        gmail_email, gmail_password, gmail_recovery_email,
-                        gmail_phone, gmail_2fa_secret, gmail_auto_login,
-                        profile_path
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    profile.name,
-                    profile.display_name,
-                    profile.user_agent,
-                    profile.proxy,
-                    profile.window_size[0],
-                    profile.window_size[1],
-                    profile.headless,
-                    profile.created_at,
-                    profile.last_used,  # Add missing last_used
-                    profile.status.value,
-                    json.dumps(profile.custom_options or []),
-                    profile.notes,
-                    profile.gmail_email,
-                    profile.gmail_password,
-                    profile.gmail_recovery_email,
-                    profile.gmail_phone,
-                    profile.gmail_2fa_secret,
-                    profile.gmail_auto_login,
-                    profile_path
-                ))
+                logger.info("✅ Database entry created successfully")
 
-                conn.commit()
-                print(f"✅ Database entry created successfully")
+                with self._lock:
+                    self._name_set.add(profile.name)
 
             except sqlite3.Error as db_error:
                 raise ValueError(f"Database error: {str(db_error)}")
-            finally:
-                if conn:
-                    conn.close()
 
-            print(f"🎉 Successfully imported profile: {profile_name}")
+            logger.info("🎉 Successfully imported profile: %s", profile_name)
             return True
 
         except Exception as e:
-            print(f"❌ Error importing profile: {e}")
+            logger.error("❌ Error importing profile: %s", e)
             return False
 
     def _remove_directory_with_retry(self, directory_path: Path, max_retries: int = 3):
@@ -644,21 +1004,21 @@ class ProfileManager:
 
         for attempt in range(max_retries):
             try:
-                print(f"🔄 Removal attempt {attempt + 1}/{max_retries}")
+                logger.debug("🔄 Removal attempt %s/%s", attempt + 1, max_retries)
 
                 # Try to make all files writable first
                 self._make_directory_writable(directory_path)
 
                 # Remove directory
                 shutil.rmtree(directory_path)
-                print(f"✅ Directory removed successfully")
+                logger.info("✅ Directory removed successfully")
                 return
 
             except Exception as e:
-                print(f"❌ Attempt {attempt + 1} failed: {e}")
+                logger.error("❌ Attempt %s failed: %s", attempt + 1, e)
 
                 if attempt < max_retries - 1:
-                    print(f"⏳ Waiting 2 seconds before retry...")
+                    logger.debug("⏳ Waiting 2 seconds before retry...")
                     time.sleep(2)
                 else:
                     raise e
@@ -686,92 +1046,127 @@ class ProfileManager:
                         pass
 
         except Exception as e:
-            print(f"⚠️ Warning: Could not make directory writable: {e}")
+            logger.warning("⚠️ Warning: Could not make directory writable: %s", e)
     
     def profile_exists(self, name: str) -> bool:
         """Check if profile exists"""
+        with self._lock:
+            if name in self._name_set:
+                return True
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM profiles WHERE name = ?', (name,))
-            count = cursor.fetchone()[0]
-            conn.close()
-            
-            return count > 0
-            
+            # Fall back to the database in case another process wrote it;
+            # SELECT 1 ... LIMIT 1 short-circuits on the first match
+            with self._cursor() as cursor:
+                cursor.execute('SELECT 1 FROM profiles WHERE name = ? LIMIT 1', (name,))
+                found = cursor.fetchone() is not None
+
+            if found:
+                with self._lock:
+                    self._name_set.add(name)
+            return found
+
         except Exception as e:
-            print(f"Error checking profile existence: {e}")
+            logger.error("Error checking profile existence: %s", e)
             return False
     
     def update_profile_status(self, name: str, status: ProfileStatus) -> bool:
         """Update profile status"""
-        return self.update_profile(name, {'status': status})
-    
+        try:
+            if not isinstance(status, ProfileStatus):
+                status = ProfileStatus(status)
+            with self._cursor(commit=True) as cursor:
+                cursor.execute(_UPDATE_STATUS_SQL, (status.value, name))
+            return True
+
+        except Exception as e:
+            logger.error("Error updating profile status: %s", e)
+            return False
+
     def update_last_used(self, name: str) -> bool:
         """Update profile last used timestamp"""
-        return self.update_profile(name, {'last_used': datetime.now().isoformat()})
+        try:
+            with self._cursor(commit=True) as cursor:
+                cursor.execute(_UPDATE_LAST_USED_SQL, (_now_iso(), name))
+            return True
+
+        except Exception as e:
+            logger.error("Error updating last used: %s", e)
+            return False
     
     def get_active_profiles(self) -> List[ChromeProfile]:
         """Get all active/running profiles"""
-        profiles = self.list_profiles()
-        return [p for p in profiles if p.status in [ProfileStatus.ACTIVE, ProfileStatus.RUNNING]]
+        try:
+            # Filter in SQL (backed by idx_profiles_status) instead of
+            # hydrating every profile just to drop most of them
+            with self._cursor() as cursor:
+                cursor.execute(f'''
+                    SELECT {PROFILE_COLS} FROM profiles
+                    WHERE status IN ('active', 'running')
+                ''')
+                rows = cursor.fetchall()
+
+            return [ChromeProfile.from_row(row) for row in rows]
+
+        except Exception as e:
+            logger.error("Error getting active profiles: %s", e)
+            return []
     
     def start_session(self, profile_name: str) -> int:
         """Start a new session for profile"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO profile_sessions (profile_name, start_time, status)
-                VALUES (?, ?, 'active')
-            ''', (profile_name, datetime.now().isoformat()))
-            
-            session_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            
-            # Update profile status
-            self.update_profile_status(profile_name, ProfileStatus.RUNNING)
-            self.update_last_used(profile_name)
-            
+            now = _now_iso()
+
+            # One transaction for the insert and the status/last_used
+            # update - a single fsync instead of three autocommits
+            with self._tx() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO profile_sessions (profile_name, start_time, status)
+                    VALUES (?, ?, 'active')
+                ''', (profile_name, now))
+
+                session_id = cursor.lastrowid
+
+                cursor.execute('''
+                    UPDATE profiles SET status = ?, last_used = ? WHERE name = ?
+                ''', (ProfileStatus.RUNNING.value, now, profile_name))
+                cursor.close()
+
             return session_id
-            
+
         except Exception as e:
-            print(f"Error starting session: {e}")
+            logger.error("Error starting session: %s", e)
             return -1
-    
+
     def end_session(self, session_id: int, pages_visited: int = 0) -> bool:
         """End a session"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get session start time
-            cursor.execute('SELECT start_time, profile_name FROM profile_sessions WHERE id = ?', (session_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                start_time = datetime.fromisoformat(row[0])
-                profile_name = row[1]
-                end_time = datetime.now()
-                duration = int((end_time - start_time).total_seconds())
-                
-                cursor.execute('''
-                    UPDATE profile_sessions 
-                    SET end_time = ?, duration = ?, pages_visited = ?, status = 'completed'
-                    WHERE id = ?
-                ''', (end_time.isoformat(), duration, pages_visited, session_id))
-                
-                conn.commit()
-                
-                # Update profile status back to inactive
-                self.update_profile_status(profile_name, ProfileStatus.INACTIVE)
-            
-            conn.close()
+            with self._tx() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT start_time, profile_name FROM profile_sessions WHERE id = ?', (session_id,))
+                row = cursor.fetchone()
+
+                if row:
+                    start_time = datetime.fromisoformat(row[0])
+                    profile_name = row[1]
+                    end_time = datetime.now()
+                    duration = int((end_time - start_time).total_seconds())
+
+                    cursor.execute('''
+                        UPDATE profile_sessions
+                        SET end_time = ?, duration = ?, pages_visited = ?, status = 'completed'
+                        WHERE id = ?
+                    ''', (end_time.isoformat(), duration, pages_visited, session_id))
+
+                    # Flip the profile back in the same commit
+                    cursor.execute('''
+                        UPDATE profiles SET status = ? WHERE name = ?
+                    ''', (ProfileStatus.INACTIVE.value, profile_name))
+                cursor.close()
+
             return True
-            
+
         except Exception as e:
-            print(f"Error ending session: {e}")
+            logger.error("Error ending session: %s", e)
             return False
@@ -4,15 +4,41 @@ Prompt Manager for AI Image Generation
 Handles reading, parsing, and managing prompts for automation
 """
 
+import atexit
 import os
-import json
+import orjson
 import csv
+import queue
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 
+# Optional: C/SIMD-accelerated CSV parsing for large prompt files
+# (install manually if needed)
+try:
+    import cisv
+except ImportError:
+    cisv = None
+
+# Optional: streaming parser so huge JSON prompt files don't need to
+# fit in memory (install manually if needed)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# JSON files above this size stream through ijson instead of one parse
+_JSON_STREAM_THRESHOLD = 10 * 1024 * 1024
+
+# Zero-padded line numbers for prompt ids, precomputed for the common case
+_ZFILL3 = tuple(f"{i:03d}" for i in range(1000))
+
 # Directories
 PROMPTS_DIR = Path("prompts")
 RESULTS_DIR = Path("results")
@@ -22,7 +48,7 @@ LOGS_DIR = Path("logs")
 for dir_path in [PROMPTS_DIR, RESULTS_DIR, LOGS_DIR]:
     dir_path.mkdir(exist_ok=True)
 
-@dataclass
+@dataclass(slots=True)
 class Prompt:
     """Single prompt data structure"""
     id: str
@@ -36,7 +62,7 @@ class Prompt:
     result_path: str = None
     error: str = None
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of image generation"""
     prompt_id: str
@@ -47,6 +73,18 @@ class GenerationResult:
     metadata: Dict[str, Any] = None
     error: str = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for serialization, without asdict's recursive copy"""
+        return {
+            'prompt_id': self.prompt_id,
+            'success': self.success,
+            'image_paths': self.image_paths,
+            'generation_time': self.generation_time,
+            'timestamp': self.timestamp,
+            'metadata': self.metadata,
+            'error': self.error
+        }
+
 class PromptManager:
     """Manager for AI image generation prompts"""
     
@@ -58,6 +96,29 @@ class PromptManager:
         # Create subdirectories
         (self.results_dir / "images").mkdir(exist_ok=True)
         (self.results_dir / "metadata").mkdir(exist_ok=True)
+
+        # list_prompt_files cache keyed on (mtime, size) per file, so
+        # repeated UI listings don't reparse unchanged prompt files
+        self._list_cache: Dict[str, tuple] = {}
+
+        # Status index over every prompt this manager has loaded, so
+        # status queries are bucket reads instead of full scans
+        self._by_status: Dict[str, set] = defaultdict(set)
+        self._by_id: Dict[str, Prompt] = {}
+
+        # Background log writer: save_result enqueues records and a
+        # daemon thread keeps the daily log handle open between writes
+        self._log_q: queue.Queue = queue.Queue()
+        threading.Thread(target=self._log_worker, daemon=True,
+                         name="pm-log-writer").start()
+        atexit.register(self._log_q.join)
+
+        # Metadata writes happen off the caller's thread; flush() waits
+        # for everything still in flight
+        self._save_pool = ThreadPoolExecutor(max_workers=2,
+                                             thread_name_prefix="pm-save")
+        self._pending_saves: set = set()
+        atexit.register(self._save_pool.shutdown)
         
         # Create example prompt files
         self._create_example_files()
@@ -117,8 +178,8 @@ Abstract geometric patterns in blue and gold
                     }
                 ]
             }
-            with open(json_example, 'w', encoding='utf-8') as f:
-                json.dump(prompts_data, f, indent=2, ensure_ascii=False)
+            with open(json_example, 'wb') as f:
+                f.write(orjson.dumps(prompts_data, option=orjson.OPT_INDENT_2))
     
     def load_prompts_from_file(self, file_path: str) -> List[Prompt]:
         """Load prompts from various file formats"""
@@ -128,116 +189,221 @@ Abstract geometric patterns in blue and gold
             raise FileNotFoundError(f"Prompt file not found: {file_path}")
         
         extension = file_path.suffix.lower()
-        
+
         if extension == '.txt':
-            return self._load_from_txt(file_path)
+            prompts = self._load_from_txt(file_path)
         elif extension == '.csv':
-            return self._load_from_csv(file_path)
+            prompts = self._load_from_csv(file_path)
         elif extension == '.json':
-            return self._load_from_json(file_path)
+            prompts = self._load_from_json(file_path)
         else:
             raise ValueError(f"Unsupported file format: {extension}")
+
+        self._register_prompts(prompts)
+        return prompts
+
+    def _register_prompts(self, prompts: List[Prompt]):
+        """Add prompts to the status index"""
+        for prompt in prompts:
+            self._by_id[prompt.id] = prompt
+            self._by_status[prompt.status].add(prompt.id)
     
     def _load_from_txt(self, file_path: Path) -> List[Prompt]:
         """Load prompts from TXT file"""
         prompts = []
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                prompt = Prompt(
-                    id=f"txt_{file_path.stem}_{i:03d}",
-                    text=line,
-                    category=file_path.stem,
-                    created_at=datetime.now().isoformat()
-                )
-                prompts.append(prompt)
-        
+        now_iso = datetime.now().isoformat()
+        stem = file_path.stem
+        # One shared string object for every prompt in this file
+        category = sys.intern(stem)
+        id_prefix = f"txt_{stem}_"
+
+        # One bulk read + C-level line split beats the per-line
+        # readline loop on large prompt files
+        buf = file_path.read_bytes()
+        for i, raw in enumerate(buf.splitlines(), 1):
+            # Skip empty lines and comments without decoding them
+            stripped = raw.strip()
+            if not stripped or stripped.startswith(b'#'):
+                continue
+
+            prompt = Prompt(
+                id=id_prefix + (_ZFILL3[i] if i < 1000 else f"{i:03d}"),
+                text=stripped.decode('utf-8'),
+                category=category,
+                created_at=now_iso
+            )
+            prompts.append(prompt)
+
         return prompts
     
+    def _iter_csv_rows(self, file_path: Path):
+        """Yield the header row then data rows, via cisv's C parser when available"""
+        if cisv is not None:
+            yield from cisv.parse_file(str(file_path))
+            return
+
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.reader(f)
+
     def _load_from_csv(self, file_path: Path) -> List[Prompt]:
         """Load prompts from CSV file"""
         prompts = []
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Parse parameters if present
-                parameters = {}
-                if 'parameters' in row and row['parameters']:
-                    try:
-                        parameters = json.loads(row['parameters'])
-                    except json.JSONDecodeError:
-                        parameters = {}
-                
-                prompt = Prompt(
-                    id=row.get('id', f"csv_{len(prompts):03d}"),
-                    text=row['prompt'],
-                    category=row.get('category', 'default'),
-                    priority=int(row.get('priority', 1)),
-                    parameters=parameters,
-                    created_at=datetime.now().isoformat()
-                )
-                prompts.append(prompt)
-        
+        now_iso = datetime.now().isoformat()
+
+        rows = self._iter_csv_rows(file_path)
+        header = next(rows, None)
+        if not header:
+            return prompts
+
+        # Positional access via a header index avoids a dict per row
+        idx = {h: i for i, h in enumerate(header)}
+        id_i = idx.get('id')
+        text_i = idx.get('prompt')
+        cat_i = idx.get('category')
+        pri_i = idx.get('priority')
+        par_i = idx.get('parameters')
+
+        for row in rows:
+            if not row:
+                continue
+
+            def col(i):
+                return row[i] if i is not None and i < len(row) else ''
+
+            # Parse parameters if present
+            parameters = {}
+            raw_params = col(par_i)
+            if raw_params:
+                try:
+                    parameters = orjson.loads(raw_params)
+                except orjson.JSONDecodeError:
+                    parameters = {}
+
+            prompt = Prompt(
+                id=col(id_i) or f"csv_{len(prompts):03d}",
+                text=col(text_i),
+                category=sys.intern(col(cat_i) or 'default'),
+                priority=int(col(pri_i) or 1),
+                parameters=parameters,
+                created_at=now_iso
+            )
+            prompts.append(prompt)
+
         return prompts
     
     def _load_from_json(self, file_path: Path) -> List[Prompt]:
         """Load prompts from JSON file"""
         prompts = []
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        prompts_data = data.get('prompts', [])
-        
+        now_iso = datetime.now().isoformat()
+
+        if ijson is not None and file_path.stat().st_size > _JSON_STREAM_THRESHOLD:
+            # Stream the prompts array so memory stays flat regardless
+            # of file size
+            with open(file_path, 'rb') as f:
+                prompts_data = ijson.items(f, 'prompts.item')
+                self._build_json_prompts(prompts, prompts_data, now_iso)
+            return prompts
+
+        # Binary read lets orjson parse the raw bytes directly
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+
+        self._build_json_prompts(prompts, data.get('prompts', []), now_iso)
+        return prompts
+
+    def _build_json_prompts(self, prompts: List[Prompt], prompts_data, now_iso: str):
+        """Turn parsed JSON prompt records into Prompt objects"""
         for prompt_data in prompts_data:
             prompt = Prompt(
                 id=prompt_data.get('id', f"json_{len(prompts):03d}"),
                 text=prompt_data['text'],
-                category=prompt_data.get('category', 'default'),
+                category=sys.intern(prompt_data.get('category', 'default')),
                 priority=prompt_data.get('priority', 1),
                 parameters=prompt_data.get('parameters', {}),
-                created_at=datetime.now().isoformat()
+                created_at=now_iso
             )
             prompts.append(prompt)
-        
-        return prompts
-    
+
     def save_result(self, result: GenerationResult) -> str:
         """Save generation result with metadata"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save metadata
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+        # Save metadata: serialize here (cheap), write in the background
         metadata_file = self.results_dir / "metadata" / f"{result.prompt_id}_{timestamp}.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(result), f, indent=2, ensure_ascii=False)
-        
-        # Log result
-        log_file = self.logs_dir / f"generation_log_{datetime.now().strftime('%Y%m%d')}.txt"
-        with open(log_file, 'a', encoding='utf-8') as f:
-            status = "SUCCESS" if result.success else "FAILED"
-            f.write(f"[{result.timestamp}] {status} - {result.prompt_id}\n")
-            if result.error:
-                f.write(f"  Error: {result.error}\n")
-            if result.image_paths:
-                f.write(f"  Images: {', '.join(result.image_paths)}\n")
-            f.write("\n")
+        payload = orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2)
+        future = self._save_pool.submit(self._write_metadata, metadata_file, payload)
+        self._pending_saves.add(future)
+        future.add_done_callback(self._pending_saves.discard)
         
+        # Log result (written by the background thread)
+        log_file = self.logs_dir / f"generation_log_{now.strftime('%Y%m%d')}.txt"
+        status = "SUCCESS" if result.success else "FAILED"
+        parts = [f"[{result.timestamp}] {status} - {result.prompt_id}\n"]
+        if result.error:
+            parts.append(f"  Error: {result.error}\n")
+        if result.image_paths:
+            parts.append(f"  Images: {', '.join(result.image_paths)}\n")
+        parts.append("\n")
+        self._log_q.put((str(log_file), "".join(parts)))
+
         return str(metadata_file)
+
+    @staticmethod
+    def _write_metadata(metadata_file: Path, payload: bytes):
+        """Write serialized result metadata (runs on the save pool)"""
+        try:
+            with open(metadata_file, 'wb') as f:
+                f.write(payload)
+        except Exception as e:
+            print(f"Error saving result metadata {metadata_file}: {e}")
+
+    def flush(self):
+        """Block until queued metadata writes and log records are on disk"""
+        for future in list(self._pending_saves):
+            future.result()
+        self._log_q.join()
+
+    def _log_worker(self):
+        """Drain the log queue, keeping the current log file open"""
+        handle = None
+        handle_path = None
+        while True:
+            batch = [self._log_q.get()]
+            try:
+                while True:
+                    try:
+                        batch.append(self._log_q.get_nowait())
+                    except queue.Empty:
+                        break
+
+                for path, record in batch:
+                    if handle is None or handle_path != path:
+                        if handle is not None:
+                            handle.close()
+                        handle = open(path, 'a', encoding='utf-8')
+                        handle_path = path
+                    handle.write(record)
+                handle.flush()
+            except Exception as e:
+                print(f"Error writing generation log: {e}")
+            finally:
+                for _ in batch:
+                    self._log_q.task_done()
     
-    def get_pending_prompts(self, prompts: List[Prompt]) -> List[Prompt]:
+    def get_pending_prompts(self, prompts: Optional[List[Prompt]] = None) -> List[Prompt]:
         """Get prompts that are pending processing"""
+        if prompts is None:
+            # O(pending) bucket read over everything this manager loaded
+            return [self._by_id[pid] for pid in self._by_status["pending"]]
         return [p for p in prompts if p.status == "pending"]
-    
+
     def update_prompt_status(self, prompt: Prompt, status: str, error: str = None):
         """Update prompt status"""
+        status = sys.intern(status)
+        self._by_status[prompt.status].discard(prompt.id)
+        self._by_status[status].add(prompt.id)
+        self._by_id[prompt.id] = prompt
         prompt.status = status
         prompt.processed_at = datetime.now().isoformat()
         if error:
@@ -245,27 +411,54 @@ Abstract geometric patterns in blue and gold
     
     def list_prompt_files(self) -> List[Dict[str, Any]]:
         """List all available prompt files"""
-        files = []
-        
-        for file_path in self.prompts_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in ['.txt', '.csv', '.json']:
-                try:
-                    prompts = self.load_prompts_from_file(str(file_path))
-                    files.append({
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "format": file_path.suffix.lower()[1:],
-                        "prompt_count": len(prompts),
-                        "size": file_path.stat().st_size,
-                        "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                    })
-                except Exception as e:
-                    files.append({
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "format": file_path.suffix.lower()[1:],
-                        "prompt_count": 0,
-                        "error": str(e)
-                    })
-        
-        return files
+        paths = [
+            p for p in self.prompts_dir.rglob("*")
+            if p.is_file() and p.suffix.lower() in ('.txt', '.csv', '.json')
+        ]
+        if not paths:
+            return []
+
+        # Parsing is I/O-bound, so fan cold files out across threads;
+        # cached files return immediately from _summarize_prompt_file
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return list(executor.map(self._summarize_prompt_file, paths))
+
+    def _summarize_prompt_file(self, file_path: Path) -> Dict[str, Any]:
+        """Build (or reuse) the listing entry for one prompt file"""
+        key = str(file_path)
+        try:
+            st = file_path.stat()
+        except OSError as e:
+            return {
+                "name": file_path.name,
+                "path": key,
+                "format": file_path.suffix.lower()[1:],
+                "prompt_count": 0,
+                "error": str(e)
+            }
+
+        cached = self._list_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        try:
+            prompts = self.load_prompts_from_file(key)
+            entry = {
+                "name": file_path.name,
+                "path": key,
+                "format": file_path.suffix.lower()[1:],
+                "prompt_count": len(prompts),
+                "size": st.st_size,
+                "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+            }
+        except Exception as e:
+            entry = {
+                "name": file_path.name,
+                "path": key,
+                "format": file_path.suffix.lower()[1:],
+                "prompt_count": 0,
+                "error": str(e)
+            }
+
+        self._list_cache[key] = (st.st_mtime_ns, st.st_size, entry)
+        return entry
@@ -6,6 +6,8 @@ Handles execution of custom Selenium scripts on Chrome profiles
 
 import os
 import json
+import mmap
+import re
 import time
 import traceback
 from pathlib import Path
@@ -19,7 +21,10 @@ import sys
 SCRIPTS_DIR = Path("scripts")
 SCRIPTS_DIR.mkdir(exist_ok=True)
 
-@dataclass
+# First module docstring, matched directly against the mmap buffer
+_DOCSTRING_RE = re.compile(rb'(?:"""|\'\'\')(.*?)(?:"""|\'\'\')', re.S)
+
+@dataclass(slots=True)
 class ScriptResult:
     """Result of script execution"""
     success: bool
@@ -29,7 +34,7 @@ class ScriptResult:
     execution_time: float = 0
     timestamp: str = None
 
-@dataclass
+@dataclass(slots=True)
 class SeleniumScript:
     """Selenium script metadata"""
     name: str
@@ -54,6 +59,14 @@ class SeleniumScriptManager:
         
         # Create default example scripts
         self._create_example_scripts()
+
+        # Loaded script modules keyed on path -> (mtime_ns, module), so
+        # repeated executions skip the parse/compile step
+        self._mod_cache: Dict[str, tuple] = {}
+
+        # name -> Path index so execute_script doesn't rglob the whole
+        # scripts tree per invocation; refreshed on miss and by list_scripts
+        self._name_index: Dict[str, Path] = {}
     
     def _create_example_scripts(self):
         """Create example scripts for users"""
@@ -66,25 +79,37 @@ Gmail Inbox Checker Script
 Checks Gmail inbox and returns unread count
 """
 
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
 def run_script(driver, profile_name, **kwargs):
     """
     Main script function
-    
+
     Args:
         driver: Selenium WebDriver instance
         profile_name: Name of the Chrome profile
         **kwargs: Additional parameters
-    
+
     Returns:
         dict: Script result
     """
     try:
         print(f"🔍 Checking Gmail for profile: {profile_name}")
-        
+
         # Navigate to Gmail
         driver.get("https://mail.google.com/mail/u/0/#inbox")
-        time.sleep(5)
-        
+
+        # Wait until the inbox (or login redirect) is usable instead of
+        # sleeping a fixed five seconds
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='main']"))
+            )
+        except Exception:
+            pass
+
         # Check if logged in
         if "accounts.google.com" in driver.current_url:
             return {
@@ -92,12 +117,14 @@ def run_script(driver, profile_name, **kwargs):
                 "message": "Not logged into Gmail",
                 "data": {"logged_in": False}
             }
-        
-        # Get unread count
+
+        # Count unread rows in one round-trip instead of materializing
+        # a WebElement per matched row
         try:
-            unread_elements = driver.find_elements("css selector", "tr.zE")
-            unread_count = len(unread_elements)
-            
+            unread_count = driver.execute_script(
+                "return document.querySelectorAll('tr.zE').length;"
+            )
+
             return {
                 "success": True,
                 "message": f"Found {unread_count} unread emails",
@@ -116,7 +143,7 @@ def run_script(driver, profile_name, **kwargs):
                     "error": str(e)
                 }
             }
-            
+
     except Exception as e:
         return {
             "success": False,
@@ -133,40 +160,46 @@ Page Screenshot Script
 Takes screenshot of current page
 """
 
-import os
-from datetime import datetime
+import time
+from pathlib import Path
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Created once at import instead of a makedirs check per screenshot
+SCREENSHOTS_DIR = Path("screenshots")
+SCREENSHOTS_DIR.mkdir(exist_ok=True)
 
 def run_script(driver, profile_name, **kwargs):
     """
     Take screenshot of current page
-    
+
     Args:
         driver: Selenium WebDriver instance
         profile_name: Name of the Chrome profile
         **kwargs: Additional parameters (url, filename)
-    
+
     Returns:
         dict: Script result
     """
     try:
         # Get parameters
         url = kwargs.get('url', driver.current_url)
-        filename = kwargs.get('filename', f"screenshot_{profile_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-        
-        # Navigate to URL if provided
+        filename = kwargs.get('filename') or f"screenshot_{profile_name}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+
+        # Navigate only when the target differs from the current page
         if url and url != driver.current_url:
             print(f"🌐 Navigating to: {url}")
             driver.get(url)
-            time.sleep(3)
-        
-        # Create screenshots directory
-        screenshots_dir = "screenshots"
-        os.makedirs(screenshots_dir, exist_ok=True)
-        
+            # Wait for the page to actually finish loading instead of a
+            # fixed three-second sleep
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+
         # Take screenshot
-        screenshot_path = os.path.join(screenshots_dir, filename)
+        screenshot_path = str(SCREENSHOTS_DIR / filename)
         driver.save_screenshot(screenshot_path)
-        
+
         return {
             "success": True,
             "message": f"Screenshot saved: {screenshot_path}",
@@ -176,7 +209,7 @@ def run_script(driver, profile_name, **kwargs):
                 "page_title": driver.title
             }
         }
-        
+
     except Exception as e:
         return {
             "success": False,
@@ -193,14 +226,20 @@ def run_script(driver, profile_name, **kwargs):
                 with open(example_path, 'w', encoding='utf-8') as f:
                     f.write(example["content"])
     
+    def _scan_scripts(self) -> Dict[str, Path]:
+        """Rebuild the name -> path index with one directory walk"""
+        self._name_index = {
+            p.name: p
+            for p in self.scripts_dir.rglob("*.py")
+            if not p.name.startswith("__")
+        }
+        return self._name_index
+
     def list_scripts(self) -> List[SeleniumScript]:
         """List all available scripts"""
         scripts = []
-        
-        for script_file in self.scripts_dir.rglob("*.py"):
-            if script_file.name.startswith("__"):
-                continue
-                
+
+        for script_file in self._scan_scripts().values():
             try:
                 script_info = self._get_script_info(script_file)
                 if script_info:
@@ -213,17 +252,21 @@ def run_script(driver, profile_name, **kwargs):
     def _get_script_info(self, script_path: Path) -> Optional[SeleniumScript]:
         """Get script information from file"""
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract docstring for description
+            # Memory-map instead of reading the whole file - only the
+            # docstring slice ever gets copied and decoded
             description = "No description available"
-            if '"""' in content:
-                start = content.find('"""') + 3
-                end = content.find('"""', start)
-                if end > start:
-                    description = content[start:end].strip()
-            
+            with open(script_path, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    mm = None  # empty file
+
+                if mm is not None:
+                    with mm:
+                        m = _DOCSTRING_RE.search(mm)
+                        if m:
+                            description = m.group(1).strip().decode('utf-8', 'replace')
+
             return SeleniumScript(
                 name=script_path.name,
                 display_name=script_path.stem.replace('_', ' ').title(),
@@ -241,13 +284,11 @@ def run_script(driver, profile_name, **kwargs):
         start_time = time.time()
         
         try:
-            # Find script file
-            script_path = None
-            for script_file in self.scripts_dir.rglob(script_name):
-                if script_file.is_file():
-                    script_path = script_file
-                    break
-            
+            # Find script file via the index, rescanning once on a miss
+            script_path = self._name_index.get(script_name)
+            if script_path is None or not script_path.is_file():
+                script_path = self._scan_scripts().get(script_name)
+
             if not script_path:
                 return ScriptResult(
                     success=False,
@@ -257,14 +298,9 @@ def run_script(driver, profile_name, **kwargs):
                     timestamp=datetime.now().isoformat()
                 )
             
-            # Load and execute script
-            spec = importlib.util.spec_from_file_location("script_module", script_path)
-            script_module = importlib.util.module_from_spec(spec)
-            
-            # Add to sys.modules to handle imports
-            sys.modules["script_module"] = script_module
-            spec.loader.exec_module(script_module)
-            
+            # Load and execute script (cached until the file changes)
+            script_module = self._load_script_module(script_path)
+
             # Execute script
             if hasattr(script_module, 'run_script'):
                 result = script_module.run_script(driver, profile_name, **kwargs)
@@ -296,7 +332,24 @@ def run_script(driver, profile_name, **kwargs):
                 execution_time=time.time() - start_time,
                 timestamp=datetime.now().isoformat()
             )
-        finally:
-            # Clean up module
-            if "script_module" in sys.modules:
-                del sys.modules["script_module"]
+
+    def _load_script_module(self, script_path: Path):
+        """Load a script module, reusing the cached one while unchanged"""
+        key = str(script_path)
+        mtime = script_path.stat().st_mtime_ns
+
+        cached = self._mod_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        # Unique module name so multiple scripts can coexist in sys.modules
+        module_name = f"script_module_{script_path.stem}"
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        script_module = importlib.util.module_from_spec(spec)
+
+        # Add to sys.modules to handle imports
+        sys.modules[module_name] = script_module
+        spec.loader.exec_module(script_module)
+
+        self._mod_cache[key] = (mtime, script_module)
+        return script_module
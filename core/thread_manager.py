@@ -4,18 +4,20 @@ Thread Manager for Multi-Threading AI Image Generation
 Handles concurrent processing of multiple prompts
 """
 
+import logging
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue, Empty
+from collections import deque
+from queue import SimpleQueue
 from typing import List, Dict, Any, Callable, Optional
 from dataclasses import dataclass
 from datetime import datetime
-import traceback
 
 from .prompt_manager import Prompt, GenerationResult, PromptManager
 from .ai_image_generator import create_generator
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class ThreadConfig:
     """Configuration for thread pool"""
@@ -33,6 +35,7 @@ class GenerationTask:
     parameters: Dict[str, Any]
     attempt: int = 1
     max_attempts: int = 2
+    task_index: int = 0  # slot in the preallocated results list
 
 @dataclass
 class BatchProgress:
@@ -76,7 +79,7 @@ class MultiThreadGenerator:
         self.prompt_manager = PromptManager()
         
         # Thread management
-        self.executor = None
+        self.worker_threads = []
         self.active_tasks = {}
         self.progress = BatchProgress()
         self.is_running = False
@@ -84,7 +87,12 @@ class MultiThreadGenerator:
         
         # Thread-safe progress tracking
         self.progress_lock = threading.Lock()
-        self.results_queue = Queue()
+
+        # Completion events flow through a SimpleQueue (C-implemented,
+        # cheap producer enqueue) to one notifier thread, which is the
+        # only consumer and the only writer of progress counters
+        self._completion_q = None
+        self._callback_interval = 0.1
         
         # Callbacks
         self.progress_callback = None
@@ -112,29 +120,27 @@ class MultiThreadGenerator:
         with self.progress_lock:
             self.progress = BatchProgress(
                 total_prompts=len(prompts),
-                start_time=time.time()
+                start_time=time.time(),
+                # Preallocated so completions do indexed stores instead
+                # of growing the list
+                results=[None] * len(prompts)
             )
             self.is_running = True
             self.stop_requested = False
-        
+
         # Create tasks
         tasks = [
             GenerationTask(
                 prompt=prompt,
                 platform=platform,
                 parameters=kwargs,
-                max_attempts=self.config.retry_attempts
+                max_attempts=self.config.retry_attempts,
+                task_index=i
             )
-            for prompt in prompts
+            for i, prompt in enumerate(prompts)
         ]
         
-        # Start thread pool
-        self.executor = ThreadPoolExecutor(
-            max_workers=min(self.config.max_workers, len(drivers))
-        )
-        
-        # Submit tasks
-        batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        batch_id = f"batch_{time.strftime('%Y%m%d_%H%M%S')}"
         
         # Start background thread to manage generation
         generation_thread = threading.Thread(
@@ -146,164 +152,290 @@ class MultiThreadGenerator:
         
         return batch_id
     
+    def generate_images_batch(self,
+                              prompts: List[Prompt],
+                              platform: str,
+                              drivers: List[Any],
+                              batch_size: int = 8,
+                              **kwargs) -> List[GenerationResult]:
+        """Synchronous fast path for homogeneous batches.
+
+        Skips the Task/deque layering entirely: every driver gets one
+        generator and a fixed share of the prompts, processed in
+        batch_size chunks so page/session setup is amortized. Results
+        come back in prompt order.
+        """
+        if not drivers:
+            raise ValueError("No drivers available for batch generation")
+
+        results: List[Optional[GenerationResult]] = [None] * len(prompts)
+        num_workers = min(self.config.max_workers, len(drivers))
+
+        def run_share(worker_id: int, driver: Any):
+            share = list(range(worker_id, len(prompts), num_workers))
+            prompt_manager = self.prompt_manager
+
+            def fail_indices(indices: List[int], error_msg: str):
+                # Errors become failed results, like on the task-queue
+                # path - never None entries or prompts stuck "processing"
+                logger.error("❌ %s", error_msg)
+                timestamp = datetime.now().isoformat()
+                for i in indices:
+                    prompt = prompts[i]
+                    results[i] = GenerationResult(
+                        prompt_id=prompt.id,
+                        success=False,
+                        timestamp=timestamp,
+                        error=error_msg
+                    )
+                    prompt_manager.update_prompt_status(prompt, "failed", error_msg)
+
+            try:
+                generator = create_generator(driver, platform, **kwargs)
+            except Exception as e:
+                fail_indices(share, f"Generator setup error: {str(e)}")
+                return
+
+            for chunk_start in range(0, len(share), batch_size):
+                chunk = share[chunk_start:chunk_start + batch_size]
+                chunk_prompts = [prompts[i] for i in chunk]
+                for prompt in chunk_prompts:
+                    prompt_manager.update_prompt_status(prompt, "processing")
+
+                try:
+                    if generator.supports_batch:
+                        chunk_results = generator.generate_images(chunk_prompts)
+                    else:
+                        chunk_results = [generator.generate_image(p) for p in chunk_prompts]
+                except Exception as e:
+                    fail_indices(chunk, f"Task processing error: {str(e)}")
+                    continue
+
+                for i, result in zip(chunk, chunk_results):
+                    results[i] = result
+                    prompt = prompts[i]
+                    if result.success:
+                        prompt.result_path = prompt_manager.save_result(result)
+                        prompt_manager.update_prompt_status(prompt, "completed")
+                    else:
+                        prompt_manager.update_prompt_status(prompt, "failed", result.error)
+
+        threads = [
+            threading.Thread(target=run_share, args=(worker_id, drivers[worker_id]),
+                             daemon=True, name=f"batch-fast-{worker_id}")
+            for worker_id in range(num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
+
     def _run_batch_generation(self, tasks: List[GenerationTask], drivers: List[Any], batch_id: str):
         """Run batch generation in background thread"""
         try:
-            print(f"🚀 Starting multi-threaded batch generation: {batch_id}")
-            print(f"📊 Tasks: {len(tasks)}, Workers: {self.config.max_workers}, Drivers: {len(drivers)}")
-            
-            # Create driver pool
-            driver_queue = Queue()
-            for driver in drivers:
-                driver_queue.put(driver)
-            
-            # Submit all tasks
-            future_to_task = {}
-            
-            for task in tasks:
-                if self.stop_requested:
-                    break
-                
-                future = self.executor.submit(
-                    self._process_single_task,
-                    task, driver_queue, batch_id
+            logger.info("🚀 Starting multi-threaded batch generation: %s", batch_id)
+            logger.info("📊 Tasks: %d, Workers: %d, Drivers: %d", len(tasks), self.config.max_workers, len(drivers))
+
+            # One deque of tasks per worker, each with its own driver
+            # pinned for the whole batch - no shared driver queue
+            num_workers = min(self.config.max_workers, len(drivers))
+            task_deques = [deque() for _ in range(num_workers)]
+            deque_locks = [threading.Lock() for _ in range(num_workers)]
+            for i, task in enumerate(tasks):
+                task_deques[i % num_workers].append(task)
+
+            # Single consumer of completion events - workers only enqueue
+            self._completion_q = SimpleQueue()
+            notifier = threading.Thread(
+                target=self._completion_notifier, daemon=True,
+                name="batch-notifier"
+            )
+            notifier.start()
+
+            # Start one long-lived worker thread per driver - no Future
+            # wrapping or as_completed condition-variable traffic
+            self.worker_threads = [
+                threading.Thread(
+                    target=self._worker_loop,
+                    args=(worker_id, task_deques, deque_locks,
+                          drivers[worker_id], batch_id),
+                    daemon=True,
+                    name=f"batch-worker-{worker_id}"
                 )
-                future_to_task[future] = task
-                
-                # Update in_progress count
-                with self.progress_lock:
-                    self.progress.in_progress += 1
-                
-                # Small delay between submissions
-                time.sleep(self.config.delay_between_batches)
-            
-            # Process completed tasks
-            for future in as_completed(future_to_task, timeout=self.config.timeout * len(tasks)):
-                if self.stop_requested:
-                    break
-                
-                task = future_to_task[future]
-                
-                try:
-                    result = future.result()
-                    self._handle_task_completion(task, result)
-                    
-                except Exception as e:
-                    print(f"❌ Task failed: {task.prompt.id} - {str(e)}")
-                    error_result = GenerationResult(
-                        prompt_id=task.prompt.id,
-                        success=False,
-                        timestamp=datetime.now().isoformat(),
-                        error=str(e)
-                    )
-                    self._handle_task_completion(task, error_result)
-            
+                for worker_id in range(num_workers)
+            ]
+            for thread in self.worker_threads:
+                thread.start()
+
+            # Wait for the workers to drain every deque; stop_generation
+            # is the escape hatch, not a deadline scaled by task count
+            for thread in self.worker_threads:
+                thread.join()
+
+            # Drain remaining completion events before finalizing
+            self._completion_q.put(None)
+            notifier.join()
+
             # Finalize batch
             self._finalize_batch(batch_id)
-            
-        except Exception as e:
-            print(f"❌ Batch generation error: {e}")
-            traceback.print_exc()
+
+        except Exception:
+            # logger.exception defers traceback formatting to the
+            # handler, so it costs nothing unless ERROR is emitted
+            logger.exception("❌ Batch generation error")
         finally:
             self._cleanup()
-    
-    def _process_single_task(self, task: GenerationTask, driver_queue: Queue, batch_id: str) -> GenerationResult:
+
+    def _take_task(self, worker_id: int, task_deques: List[deque], deque_locks: List[threading.Lock]) -> Optional[GenerationTask]:
+        """Pop from the worker's own deque, stealing from peers when empty"""
+        own_lock = deque_locks[worker_id]
+        own_deque = task_deques[worker_id]
+        with own_lock:
+            if own_deque:
+                return own_deque.pop()
+
+        # Own deque drained - steal the oldest task from a busy peer
+        for peer_id, peer_deque in enumerate(task_deques):
+            if peer_id == worker_id:
+                continue
+            with deque_locks[peer_id]:
+                if peer_deque:
+                    return peer_deque.popleft()
+
+        return None
+
+    def _worker_loop(self, worker_id: int, task_deques: List[deque], deque_locks: List[threading.Lock], driver: Any, batch_id: str):
+        """Process tasks with a pinned driver until every deque is empty"""
+        # Generators are cached per worker: with the driver pinned, a
+        # homogeneous batch constructs one generator instead of one per task
+        generators: Dict[Any, Any] = {}
+
+        while not self.stop_requested:
+            task = self._take_task(worker_id, task_deques, deque_locks)
+            if task is None:
+                break
+
+            self._completion_q.put((task, None))  # task started
+            result = self._process_single_task(task, driver, batch_id, generators)
+            self._handle_task_completion(task, result)
+
+    def _process_single_task(self, task: GenerationTask, driver: Any, batch_id: str, generators: Dict[Any, Any]) -> GenerationResult:
         """Process a single generation task"""
-        driver = None
-        
+        # Bind the hot attributes once - this runs once per task on
+        # every worker
+        prompt = task.prompt
+        prompt_manager = self.prompt_manager
+
         try:
-            # Get available driver
-            driver = driver_queue.get(timeout=30)
-            
-            print(f"🎨 Processing: {task.prompt.text[:50]}... (Attempt {task.attempt})")
-            
-            # Create generator for this driver
-            generator = create_generator(driver, task.platform, **task.parameters)
-            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎨 Processing: %s... (Attempt %d)", prompt.text[:50], task.attempt)
+
+            # Reuse the worker's generator for this platform/parameter set
+            key = (task.platform, id(task.parameters))
+            generator = generators.get(key)
+            if generator is None:
+                generator = create_generator(driver, task.platform, **task.parameters)
+                generators[key] = generator
+
             # Update prompt status
-            self.prompt_manager.update_prompt_status(task.prompt, "processing")
-            
-            # Generate image
-            result = generator.generate_image(task.prompt)
-            
-            # Save result
-            if result.success:
-                metadata_path = self.prompt_manager.save_result(result)
-                self.prompt_manager.update_prompt_status(task.prompt, "completed")
-                task.prompt.result_path = metadata_path
-                print(f"✅ Success: {task.prompt.id} - {len(result.image_paths or [])} images")
-            else:
-                self.prompt_manager.update_prompt_status(task.prompt, "failed", result.error)
-                print(f"❌ Failed: {task.prompt.id} - {result.error}")
-            
-            return result
-            
+            prompt_manager.update_prompt_status(prompt, "processing")
+
+            # Generate image - persistence happens on the notifier thread
+            return generator.generate_image(prompt)
+
         except Exception as e:
             error_msg = f"Task processing error: {str(e)}"
-            print(f"❌ {error_msg}")
-            
+            logger.error("❌ %s", error_msg)
+
             return GenerationResult(
-                prompt_id=task.prompt.id,
+                prompt_id=prompt.id,
                 success=False,
                 timestamp=datetime.now().isoformat(),
                 error=error_msg
             )
-            
-        finally:
-            # Return driver to pool
-            if driver:
-                driver_queue.put(driver)
     
     def _handle_task_completion(self, task: GenerationTask, result: GenerationResult):
-        """Handle completion of a single task"""
-        with self.progress_lock:
-            self.progress.completed += 1
-            self.progress.in_progress -= 1
-            self.progress.results.append(result)
-            
+        """Hand a completed task to the notifier thread"""
+        self._completion_q.put((task, result))
+
+    def _completion_notifier(self):
+        """Apply completion events and rate-limit progress callbacks.
+
+        Sole consumer of _completion_q and sole writer of the progress
+        counters, so no lock is needed on the completion path.
+        """
+        last_callback = 0.0
+        while True:
+            event = self._completion_q.get()
+            if event is None:
+                break
+
+            task, result = event
+            progress = self.progress
+            if result is None:
+                progress.in_progress += 1
+                continue
+
+            progress.completed += 1
+            progress.in_progress -= 1
+            progress.results[task.task_index] = result
+
+            # Persist off the worker threads: save_result already queues
+            # its disk writes, so workers never wait on result I/O
             if result.success:
-                self.progress.successful += 1
+                progress.successful += 1
+                metadata_path = self.prompt_manager.save_result(result)
+                self.prompt_manager.update_prompt_status(task.prompt, "completed")
+                task.prompt.result_path = metadata_path
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("✅ Success: %s - %d images", task.prompt.id, len(result.image_paths or []))
             else:
-                self.progress.failed += 1
-            
-            # Call progress callback
-            if self.progress_callback:
-                try:
-                    self.progress_callback(self.progress)
-                except Exception as e:
-                    print(f"⚠️ Progress callback error: {e}")
+                progress.failed += 1
+                self.prompt_manager.update_prompt_status(task.prompt, "failed", result.error)
+                logger.warning("❌ Failed: %s - %s", task.prompt.id, result.error)
+
+            # Batch callback dispatch instead of one call per task
+            now = time.monotonic()
+            if self.progress_callback and now - last_callback >= self._callback_interval:
+                last_callback = now
+                self._dispatch_progress_callback()
+
+        # Final state always gets reported
+        if self.progress_callback:
+            self._dispatch_progress_callback()
+
+    def _dispatch_progress_callback(self):
+        try:
+            self.progress_callback(self.progress)
+        except Exception as e:
+            logger.warning("⚠️ Progress callback error: %s", e)
     
     def _finalize_batch(self, batch_id: str):
         """Finalize batch generation"""
         with self.progress_lock:
-            print(f"🎉 Batch completed: {batch_id}")
-            print(f"📊 Results: {self.progress.successful} successful, {self.progress.failed} failed")
-            print(f"⏱️ Total time: {self.progress.elapsed_time:.1f}s")
+            logger.info("🎉 Batch completed: %s", batch_id)
+            logger.info("📊 Results: %d successful, %d failed", self.progress.successful, self.progress.failed)
+            logger.info("⏱️ Total time: %.1fs", self.progress.elapsed_time)
             
             # Call completion callback
             if self.completion_callback:
                 try:
                     self.completion_callback(self.progress)
                 except Exception as e:
-                    print(f"⚠️ Completion callback error: {e}")
+                    logger.warning("⚠️ Completion callback error: %s", e)
     
     def _cleanup(self):
         """Cleanup resources"""
         with self.progress_lock:
             self.is_running = False
-        
-        if self.executor:
-            self.executor.shutdown(wait=False)
-            self.executor = None
-    
+        self.worker_threads = []
+
     def stop_generation(self):
         """Stop ongoing generation"""
-        print("🛑 Stopping batch generation...")
+        logger.info("🛑 Stopping batch generation...")
         self.stop_requested = True
-        
-        if self.executor:
-            self.executor.shutdown(wait=False)
-        
         self._cleanup()
     
     def get_progress(self) -> BatchProgress:
@@ -321,19 +453,27 @@ class ProfileDriverPool:
     def __init__(self, profile_manager):
         self.profile_manager = profile_manager
         self.active_drivers = {}
-    
-    def get_available_drivers(self) -> List[Any]:
-        """Get list of available Chrome drivers"""
-        return list(self.active_drivers.values())
-    
+        # Copy-on-write snapshot: reads share this immutable tuple,
+        # mutations rebuild it under the lock
+        self._drivers_snapshot = ()
+        self._pool_lock = threading.Lock()
+
+    def get_available_drivers(self) -> tuple:
+        """Get the current snapshot of available Chrome drivers"""
+        return self._drivers_snapshot
+
     def add_driver(self, profile_name: str, driver_manager):
         """Add driver to pool"""
-        self.active_drivers[profile_name] = driver_manager
-    
+        with self._pool_lock:
+            self.active_drivers[profile_name] = driver_manager
+            self._drivers_snapshot = tuple(self.active_drivers.values())
+
     def remove_driver(self, profile_name: str):
         """Remove driver from pool"""
-        if profile_name in self.active_drivers:
-            del self.active_drivers[profile_name]
+        with self._pool_lock:
+            if profile_name in self.active_drivers:
+                del self.active_drivers[profile_name]
+                self._drivers_snapshot = tuple(self.active_drivers.values())
     
     def get_driver_count(self) -> int:
         """Get number of available drivers"""
@@ -9,6 +9,12 @@ import time
 
 def test_api():
     base_url = "http://127.0.0.1:5000"
+
+    # One pooled session keeps the TCP connection alive across calls
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
     
     print("🧪 Chrome Profiles Manager - Quick API Test")
     print("=" * 50)
@@ -16,7 +22,7 @@ def test_api():
     # Test 1: Server connection
     print("1. Testing server connection...")
     try:
-        response = requests.get(f"{base_url}/")
+        response = session.get(f"{base_url}/")
         if response.status_code == 200:
             print("   ✅ Server is running")
         else:
@@ -29,7 +35,7 @@ def test_api():
     # Test 2: Get system status
     print("\n2. Testing GET /api/status...")
     try:
-        response = requests.get(f"{base_url}/api/status")
+        response = session.get(f"{base_url}/api/status")
         data = response.json()
         if data.get('success'):
             status = data.get('status', {})
@@ -42,7 +48,7 @@ def test_api():
     # Test 3: Get profiles (initially empty)
     print("\n3. Testing GET /api/profiles...")
     try:
-        response = requests.get(f"{base_url}/api/profiles")
+        response = session.get(f"{base_url}/api/profiles")
         data = response.json()
         if data.get('success'):
             profiles = data.get('profiles', [])
@@ -64,10 +70,9 @@ def test_api():
     }
     
     try:
-        response = requests.post(
+        response = session.post(
             f"{base_url}/api/profiles",
-            json=profile_data,
-            headers={"Content-Type": "application/json"}
+            json=profile_data
         )
         data = response.json()
         if data.get('success'):
@@ -80,7 +85,7 @@ def test_api():
     # Test 5: Get specific profile
     print("\n5. Testing GET /api/profiles/quick_test_profile...")
     try:
-        response = requests.get(f"{base_url}/api/profiles/quick_test_profile")
+        response = session.get(f"{base_url}/api/profiles/quick_test_profile")
         data = response.json()
         if data.get('success'):
             profile = data.get('profile', {})
@@ -98,10 +103,9 @@ def test_api():
     }
     
     try:
-        response = requests.put(
+        response = session.put(
             f"{base_url}/api/profiles/quick_test_profile",
-            json=update_data,
-            headers={"Content-Type": "application/json"}
+            json=update_data
         )
         data = response.json()
         if data.get('success'):
@@ -114,7 +118,7 @@ def test_api():
     # Test 7: Start browser (this might take time)
     print("\n7. Testing POST /api/profiles/quick_test_profile/start...")
     try:
-        response = requests.post(f"{base_url}/api/profiles/quick_test_profile/start")
+        response = session.post(f"{base_url}/api/profiles/quick_test_profile/start")
         data = response.json()
         if data.get('success'):
             print(f"   ✅ Browser start initiated: {data.get('message', 'Success')}")
@@ -130,10 +134,9 @@ def test_api():
     navigate_data = {"url": "https://httpbin.org/user-agent"}
     
     try:
-        response = requests.post(
+        response = session.post(
             f"{base_url}/api/profiles/quick_test_profile/navigate",
-            json=navigate_data,
-            headers={"Content-Type": "application/json"}
+            json=navigate_data
         )
         data = response.json()
         if data.get('success'):
@@ -148,7 +151,7 @@ def test_api():
     # Test 9: Stop browser
     print("\n9. Testing POST /api/profiles/quick_test_profile/stop...")
     try:
-        response = requests.post(f"{base_url}/api/profiles/quick_test_profile/stop")
+        response = session.post(f"{base_url}/api/profiles/quick_test_profile/stop")
         data = response.json()
         if data.get('success'):
             print(f"   ✅ Browser stopped: {data.get('message', 'Success')}")
@@ -162,7 +165,7 @@ def test_api():
     # Test 10: Delete profile
     print("\n10. Testing DELETE /api/profiles/quick_test_profile...")
     try:
-        response = requests.delete(f"{base_url}/api/profiles/quick_test_profile")
+        response = session.delete(f"{base_url}/api/profiles/quick_test_profile")
         data = response.json()
         if data.get('success'):
             print(f"   ✅ Profile deleted: {data.get('message', 'Success')}")
@@ -174,7 +177,7 @@ def test_api():
     # Test 11: Error handling - Get non-existent profile
     print("\n11. Testing error handling (GET non-existent profile)...")
     try:
-        response = requests.get(f"{base_url}/api/profiles/non_existent_profile")
+        response = session.get(f"{base_url}/api/profiles/non_existent_profile")
         if response.status_code == 404:
             print("   ✅ Correctly returned 404 for non-existent profile")
         else:
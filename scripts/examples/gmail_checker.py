@@ -4,25 +4,37 @@ Gmail Inbox Checker Script
 Checks Gmail inbox and returns unread count
 """
 
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
 def run_script(driver, profile_name, **kwargs):
     """
     Main script function
-    
+
     Args:
         driver: Selenium WebDriver instance
         profile_name: Name of the Chrome profile
         **kwargs: Additional parameters
-    
+
     Returns:
         dict: Script result
     """
     try:
         print(f"🔍 Checking Gmail for profile: {profile_name}")
-        
+
         # Navigate to Gmail
         driver.get("https://mail.google.com/mail/u/0/#inbox")
-        time.sleep(5)
-        
+
+        # Wait until the inbox (or login redirect) is usable instead of
+        # sleeping a fixed five seconds
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='main']"))
+            )
+        except Exception:
+            pass
+
         # Check if logged in
         if "accounts.google.com" in driver.current_url:
             return {
@@ -30,12 +42,14 @@ def run_script(driver, profile_name, **kwargs):
                 "message": "Not logged into Gmail",
                 "data": {"logged_in": False}
             }
-        
-        # Get unread count
+
+        # Count unread rows in one round-trip instead of materializing
+        # a WebElement per matched row
         try:
-            unread_elements = driver.find_elements("css selector", "tr.zE")
-            unread_count = len(unread_elements)
-            
+            unread_count = driver.execute_script(
+                "return document.querySelectorAll('tr.zE').length;"
+            )
+
             return {
                 "success": True,
                 "message": f"Found {unread_count} unread emails",
@@ -54,7 +68,7 @@ def run_script(driver, profile_name, **kwargs):
                     "error": str(e)
                 }
             }
-            
+
     except Exception as e:
         return {
             "success": False,
@@ -4,40 +4,46 @@ Page Screenshot Script
 Takes screenshot of current page
 """
 
-import os
-from datetime import datetime
+import time
+from pathlib import Path
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Created once at import instead of a makedirs check per screenshot
+SCREENSHOTS_DIR = Path("screenshots")
+SCREENSHOTS_DIR.mkdir(exist_ok=True)
 
 def run_script(driver, profile_name, **kwargs):
     """
     Take screenshot of current page
-    
+
     Args:
         driver: Selenium WebDriver instance
         profile_name: Name of the Chrome profile
         **kwargs: Additional parameters (url, filename)
-    
+
     Returns:
         dict: Script result
     """
     try:
         # Get parameters
         url = kwargs.get('url', driver.current_url)
-        filename = kwargs.get('filename', f"screenshot_{profile_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-        
-        # Navigate to URL if provided
+        filename = kwargs.get('filename') or f"screenshot_{profile_name}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+
+        # Navigate only when the target differs from the current page
         if url and url != driver.current_url:
             print(f"🌐 Navigating to: {url}")
             driver.get(url)
-            time.sleep(3)
-        
-        # Create screenshots directory
-        screenshots_dir = "screenshots"
-        os.makedirs(screenshots_dir, exist_ok=True)
-        
+            # Wait for the page to actually finish loading instead of a
+            # fixed three-second sleep
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+
         # Take screenshot
-        screenshot_path = os.path.join(screenshots_dir, filename)
+        screenshot_path = str(SCREENSHOTS_DIR / filename)
         driver.save_screenshot(screenshot_path)
-        
+
         return {
             "success": True,
             "message": f"Screenshot saved: {screenshot_path}",
@@ -47,7 +53,7 @@ def run_script(driver, profile_name, **kwargs):
                 "page_title": driver.title
             }
         }
-        
+
     except Exception as e:
         return {
             "success": False,
@@ -16,9 +16,13 @@ def test_import():
     }
     
     print(f"Testing import with data: {data}")
-    
+
+    # Pooled session so retries/repeat runs reuse the connection
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
     try:
-        response = requests.post(url, json=data, timeout=60)
+        response = session.post(url, json=data, timeout=60)
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text}")
         
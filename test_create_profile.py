@@ -4,7 +4,12 @@ Test script to debug profile creation API
 """
 
 import requests
-import json
+import orjson
+
+# One pooled session so repeat runs reuse the same keep-alive connection
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def test_create_profile():
     url = "http://127.0.0.1:5000/api/profiles"
@@ -23,24 +28,28 @@ def test_create_profile():
     
     print("Testing profile creation API...")
     print(f"URL: {url}")
-    print(f"Data: {json.dumps(profile_data, indent=2)}")
+    print(f"Data: {orjson.dumps(profile_data, option=orjson.OPT_INDENT_2).decode()}")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             url,
-            json=profile_data,
-            headers={"Content-Type": "application/json"}
+            data=orjson.dumps(profile_data)
         )
         
+        # Parse the body once; only the error branch needs the raw text
+        body = response.content
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            data = None
+
         print(f"\nResponse Status: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
-        print(f"Response Text: {response.text}")
-        
-        if response.status_code == 200:
-            data = response.json()
+
+        if response.status_code == 200 and data is not None:
             print(f"Success: {data}")
         else:
-            print(f"Error: {response.status_code} - {response.text}")
+            print(f"Error: {response.status_code} - {body.decode('utf-8', 'replace')}")
             
     except Exception as e:
         print(f"Exception: {e}")
@@ -6,13 +6,22 @@ This script demonstrates how to use the Chrome Profiles Manager
 to create profiles and control browsers programmatically.
 """
 
+import os
+import sys
 import time
 import asyncio
+import threading
+from pathlib import Path
 from core.profile_manager import ProfileManager, ChromeProfile, ProfileStatus
 from core.chrome_driver import ChromeDriverManager
 from core.bot_bypass import BotBypassManager
 
 
+def _interactive():
+    """True when a human can actually answer the prompts"""
+    return not os.environ.get('CI') and sys.stdin.isatty()
+
+
 def test_profile_management():
     """Test profile creation and management"""
     print("🧪 Testing Profile Management...")
@@ -80,8 +89,16 @@ def test_browser_automation(profile_name):
         
         # Take a screenshot (optional)
         try:
-            driver.save_screenshot(f"screenshots/test_{profile_name}.png")
-            print("📸 Screenshot saved")
+            # Capture in memory and flush to disk in the background so
+            # the test flow doesn't block on the file write
+            png = driver.get_screenshot_as_png()
+
+            def _flush_screenshot(data=png, name=profile_name):
+                Path("screenshots").mkdir(exist_ok=True)
+                Path(f"screenshots/test_{name}.png").write_bytes(data)
+
+            threading.Thread(target=_flush_screenshot, daemon=True).start()
+            print("📸 Screenshot captured")
         except:
             print("⚠️ Could not save screenshot")
         
@@ -110,7 +127,8 @@ def test_browser_automation(profile_name):
         print("✅ Browser automation test completed successfully!")
         
         # Keep browser open for manual inspection
-        input("\n⏸️ Press Enter to close the browser...")
+        if _interactive():
+            input("\n⏸️ Press Enter to close the browser...")
         
     except Exception as e:
         print(f"❌ Error during browser automation: {e}")
@@ -167,10 +185,12 @@ def main():
         # Test 1: Profile Management
         profile_name = test_profile_management()
         
-        # Test 2: Browser Automation (optional - requires user interaction)
-        choice = input("\n❓ Do you want to test browser automation? (y/n): ").lower()
-        if choice == 'y':
-            test_browser_automation(profile_name)
+        # Test 2: Browser Automation (optional - requires user interaction,
+        # so unattended runs skip straight past it)
+        if _interactive():
+            choice = input("\n❓ Do you want to test browser automation? (y/n): ").lower()
+            if choice == 'y':
+                test_browser_automation(profile_name)
         
         # Test 3: API Simulation
         test_api_simulation()
@@ -181,8 +201,12 @@ def main():
         print(f"\n❌ Test failed with error: {e}")
         
     finally:
-        # Cleanup
-        cleanup_choice = input("\n❓ Do you want to clean up test data? (y/n): ").lower()
+        # Cleanup - unattended runs always clean up so repeat runs
+        # don't accumulate test profiles
+        if _interactive():
+            cleanup_choice = input("\n❓ Do you want to clean up test data? (y/n): ").lower()
+        else:
+            cleanup_choice = 'y'
         if cleanup_choice == 'y':
             cleanup_test_data()
         
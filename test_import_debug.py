@@ -4,8 +4,19 @@ Debug script for import profile issue
 """
 
 import requests
-import json
+import orjson
 import os
+from functools import lru_cache
+
+# One pooled session so both tests share a keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+@lru_cache(maxsize=32)
+def _cached_get(url):
+    """Memoized GET for the run, returning (status_code, raw body)"""
+    response = SESSION.get(url)
+    return response.status_code, response.content
 
 def test_import_profile():
     """Test import profile with specific path"""
@@ -20,12 +31,18 @@ def test_import_profile():
     if os.path.exists(test_path):
         print(f"📊 Directory contents:")
         try:
-            contents = os.listdir(test_path)
-            for item in contents[:10]:  # Show first 10 items
-                item_path = os.path.join(test_path, item)
-                print(f"  - {item} ({'dir' if os.path.isdir(item_path) else 'file'})")
-            if len(contents) > 10:
-                print(f"  ... and {len(contents) - 10} more items")
+            # Single scandir pass - DirEntry.is_dir() uses the cached
+            # directory entry instead of a stat() per item
+            shown = 0
+            total = 0
+            with os.scandir(test_path) as it:
+                for entry in it:
+                    total += 1
+                    if shown < 10:  # Show first 10 items
+                        print(f"  - {entry.name} ({'dir' if entry.is_dir() else 'file'})")
+                        shown += 1
+            if total > 10:
+                print(f"  ... and {total - 10} more items")
         except Exception as e:
             print(f"❌ Error reading directory: {e}")
     
@@ -39,21 +56,29 @@ def test_import_profile():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://127.0.0.1:5000/api/import-profile",
-            json=data,
+            data=orjson.dumps(data),
             headers={"Content-Type": "application/json"},
             timeout=60
         )
         
+        # Parse the body once from the raw bytes; decode to text only
+        # for the error branch
+        body = response.content
+        try:
+            result = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            result = None
+
         print(f"📊 Response status: {response.status_code}")
-        print(f"📊 Response text: {response.text}")
-        
-        if response.status_code == 200:
-            result = response.json()
+
+        if response.status_code == 200 and result is not None:
+            # The import created a profile - drop any memoized GETs
+            _cached_get.cache_clear()
             print(f"✅ Success: {result}")
         else:
-            print(f"❌ Failed: {response.text}")
+            print(f"❌ Failed: {body[:500].decode('utf-8', 'replace')}")
             
     except Exception as e:
         print(f"❌ Request error: {e}")
@@ -63,19 +88,19 @@ def test_system_profiles():
     print(f"\n🔍 Testing system profiles detection...")
     
     try:
-        response = requests.get("http://127.0.0.1:5000/api/system-profiles")
-        
-        if response.status_code == 200:
-            data = response.json()
+        status_code, body = _cached_get("http://127.0.0.1:5000/api/system-profiles")
+
+        if status_code == 200:
+            data = orjson.loads(body)
             print(f"📊 Found {len(data.get('profiles', []))} profiles")
-            
+
             for profile in data.get('profiles', []):
                 print(f"  - {profile['name']}: {profile['path']}")
                 if 'Profile 2' in profile['path']:
                     print(f"    ✅ Found target profile!")
                     print(f"    📊 Details: {profile}")
         else:
-            print(f"❌ API error: {response.text}")
+            print(f"❌ API error: {body.decode('utf-8', 'replace')}")
             
     except Exception as e:
         print(f"❌ Request error: {e}")
@@ -4,112 +4,200 @@ Test script to debug profile import functionality
 """
 
 import requests
-import json
+import orjson
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import simdjson  # optional - reusable parser amortizes its buffers
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson  # optional - streams large profile lists incrementally
+except ImportError:
+    ijson = None
+
+# One parser per probe thread: a simdjson document only stays valid
+# until its parser's next parse, so threads must not share one
+_TLS = threading.local()
+
+def _parse(body):
+    """Parse response bytes, reusing a simdjson parser when available"""
+    if simdjson is None:
+        return orjson.loads(body)
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = simdjson.Parser()
+    return parser.parse(body)
+
+# (connect, read) - a hung server fails a probe instead of wedging the run
+DEFAULT_TIMEOUT = (1.0, 5.0)
+
+class TimeoutHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request"""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+# One pooled session so every probe reuses the same keep-alive connection
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+SESSION.mount("http://", TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 def test_system_profiles():
     """Test system profiles detection"""
-    print("🔍 Testing system profiles detection...")
-    
+    lines = ["🔍 Testing system profiles detection..."]
+
     try:
-        response = requests.get("http://127.0.0.1:5000/api/system-profiles")
-        print(f"Status: {response.status_code}")
-        
+        response = SESSION.get("http://127.0.0.1:5000/api/system-profiles")
+        lines.append(f"Status: {response.status_code}")
+
         if response.status_code == 200:
-            data = response.json()
-            print(f"Success: {data['success']}")
-            print(f"Count: {data.get('count', 0)}")
-            
+            data = _parse(response.content)
+            lines.append(f"Success: {data['success']}")
+            lines.append(f"Count: {data.get('count', 0)}")
+
             if data['profiles']:
-                print("\nFound profiles:")
+                lines.append("\nFound profiles:")
                 for i, profile in enumerate(data['profiles']):
-                    print(f"  {i+1}. {profile['display_name']}")
-                    print(f"     Path: {profile['path']}")
-                    print(f"     Size: {profile['size_mb']} MB")
-                    print(f"     Account: {profile['account_info'].get('email', 'N/A')}")
-                    print()
+                    # Pull each field once into a local, then append the
+                    # whole block as a single string
+                    name, path, size = profile['display_name'], profile['path'], profile['size_mb']
+                    email = profile['account_info'].get('email', 'N/A')
+                    lines.append(
+                        f"  {i+1}. {name}\n"
+                        f"     Path: {path}\n"
+                        f"     Size: {size} MB\n"
+                        f"     Account: {email}\n"
+                    )
             else:
-                print("No profiles found")
+                lines.append("No profiles found")
         else:
-            print(f"Error: {response.text}")
-            
+            lines.append(f"Error: {response.text}")
+
     except Exception as e:
-        print(f"Exception: {e}")
+        lines.append(f"Exception: {e}")
+
+    return lines
+
+# Resolve the home directory once at import - expanduser re-reads the
+# environment on every call
+_CHROME_USER_DATA = Path.home() / "AppData" / "Local" / "Google" / "Chrome" / "User Data"
+_PUBLIC_TEST_PATH = Path(r"C:\Users\Public\Desktop\test_profile")
+
+# Static portion of the import payload, shared across probes
+_IMPORT_TEMPLATE = {
+    "profile_name": "test_imported_profile",
+    "display_name": "Test Imported Profile"
+}
+
+def _import_probe(path):
+    """Attempt one import; returns (path, status code, response text)"""
+    profile_data = {**_IMPORT_TEMPLATE, "source_path": path}
+    response = SESSION.post(
+        "http://127.0.0.1:5000/api/import-profile",
+        json=profile_data
+    )
+    return path, response.status_code, response.text
 
 def test_import_profile():
     """Test profile import with manual path"""
-    print("\n🔍 Testing profile import...")
-    
-    # Common Chrome profile paths
+    lines = ["\n🔍 Testing profile import..."]
+
+    # The Chrome candidates share one parent - a single scandir listing
+    # answers both existence checks instead of a stat per path
+    try:
+        siblings = {entry.name for entry in os.scandir(_CHROME_USER_DATA)}
+    except OSError:
+        siblings = set()
+
     test_paths = [
-        os.path.expanduser("~\\AppData\\Local\\Google\\Chrome\\User Data\\Default"),
-        os.path.expanduser("~\\AppData\\Local\\Google\\Chrome\\User Data\\Profile 1"),
-        "C:\\Users\\Public\\Desktop\\test_profile"  # Test with non-existent path
+        (str(_CHROME_USER_DATA / "Default"), "Default" in siblings),
+        (str(_CHROME_USER_DATA / "Profile 1"), "Profile 1" in siblings),
+        # Test with non-existent path - unrelated parent, so stat it directly
+        (str(_PUBLIC_TEST_PATH), _PUBLIC_TEST_PATH.exists()),
     ]
-    
-    for path in test_paths:
-        print(f"\nTesting path: {path}")
-        print(f"Exists: {os.path.exists(path)}")
-        
-        if os.path.exists(path):
-            # Test import
-            profile_data = {
-                "source_path": path,
-                "profile_name": "test_imported_profile",
-                "display_name": "Test Imported Profile"
-            }
-            
-            try:
-                response = requests.post(
-                    "http://127.0.0.1:5000/api/import-profile",
-                    json=profile_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                print(f"Import status: {response.status_code}")
-                print(f"Response: {response.text}")
-                
-                if response.status_code == 200:
-                    print("✅ Import successful!")
+
+    candidates = []
+    for path, exists in test_paths:
+        lines.append(f"\nTesting path: {path}")
+        lines.append(f"Exists: {exists}")
+        if exists:
+            candidates.append(path)
+
+    if candidates:
+        # Probe candidate paths in parallel; the first 200 wins
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_import_probe, path) for path in candidates]
+            for future in as_completed(futures):
+                try:
+                    path, status, text = future.result()
+                except Exception as e:
+                    lines.append(f"Exception during import: {e}")
+                    continue
+
+                lines.append(f"\nImport from {path} - status: {status}")
+                lines.append(f"Response: {text}")
+
+                if status == 200:
+                    lines.append("✅ Import successful!")
                     break
                 else:
-                    print("❌ Import failed")
-                    
-            except Exception as e:
-                print(f"Exception during import: {e}")
+                    lines.append("❌ Import failed")
+
+    return lines
 
 def test_profiles_list():
     """Test profiles list after import"""
-    print("\n🔍 Testing profiles list...")
-    
+    lines = ["\n🔍 Testing profiles list..."]
+
     try:
-        response = requests.get("http://127.0.0.1:5000/api/profiles")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Total profiles: {len(data.get('profiles', []))}")
-            
-            for profile in data.get('profiles', []):
-                print(f"- {profile['name']}: {profile['display_name']}")
+        if ijson is not None:
+            # Stream profile objects as they parse instead of buffering
+            # the whole body and materializing the full list
+            with SESSION.get("http://127.0.0.1:5000/api/profiles", stream=True) as response:
+                if response.status_code == 200:
+                    profile_lines = []
+                    for profile in ijson.items(response.raw, 'profiles.item'):
+                        profile_lines.append(f"- {profile['name']}: {profile['display_name']}")
+                    lines.append(f"Total profiles: {len(profile_lines)}")
+                    lines.extend(profile_lines)
+                else:
+                    lines.append(f"Error: {response.text}")
         else:
-            print(f"Error: {response.text}")
-            
+            response = SESSION.get("http://127.0.0.1:5000/api/profiles")
+
+            if response.status_code == 200:
+                data = _parse(response.content)
+                lines.append(f"Total profiles: {len(data.get('profiles', []))}")
+
+                for profile in data.get('profiles', []):
+                    lines.append(f"- {profile['name']}: {profile['display_name']}")
+            else:
+                lines.append(f"Error: {response.text}")
+
     except Exception as e:
-        print(f"Exception: {e}")
+        lines.append(f"Exception: {e}")
+
+    return lines
 
 def main():
     print("🧪 Chrome Profile Import Debug Test")
     print("=" * 50)
-    
-    # Test 1: System profiles detection
-    test_system_profiles()
-    
-    # Test 2: Profile import
-    test_import_profile()
-    
-    # Test 3: Profiles list
-    test_profiles_list()
-    
+
+    # The probes hit independent endpoints - run them together and print
+    # each block afterwards so stdout isn't interleaved
+    probes = (test_system_profiles, test_import_profile, test_profiles_list)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        blocks = [executor.submit(probe) for probe in probes]
+        for block in blocks:
+            print("\n".join(block.result()))
+
     print("\n✅ Debug test completed!")
 
 if __name__ == "__main__":